@@ -9,7 +9,7 @@ from pathlib import Path
 from ganban.cli._common import output_json
 from ganban.git import fetch_sync, get_remotes_sync, get_upstream, push_sync, remote_has_branch
 from ganban.model.loader import load_board
-from ganban.model.writer import check_remote_for_merge, try_auto_merge
+from ganban.model.writer import check_remote_for_merge, invalidate_ref_cache, try_auto_merge
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +49,7 @@ def _do_sync(repo_path: str) -> tuple[int, dict]:
             result["fetched"].append(remote)
         except Exception as e:
             logger.warning("fetch %s failed: %s", remote, e)
+    invalidate_ref_cache(repo_path)
 
     # Merge order: non-upstream first, then upstream last
     merge_order = [r for r in remotes if r != upstream_remote] + [upstream_remote]
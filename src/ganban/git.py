@@ -1,11 +1,19 @@
 """Git operations for ganban, with sync and async variants."""
 
 import asyncio
+import os
+import shutil
+import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from git import InvalidGitRepositoryError, Repo
 
+# subprocess only posix_spawns git (rather than forking this process, board
+# and all) for an absolute executable with no cwd and close_fds=False.
+GIT = shutil.which("git") or "git"
+
 GANBAN_DEFAULTS = {
     "sync-interval": 30,
     "sync-local": True,
@@ -13,6 +21,20 @@ GANBAN_DEFAULTS = {
 }
 
 
+def git_argv(repo_path: str | Path, *args: str) -> list[str]:
+    """Build a git command line that runs in repo_path via -C instead of a cwd."""
+    return [GIT, "-C", str(repo_path), *args]
+
+
+def run_git(repo_path: str | Path, args: list[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    """subprocess.run a git command in repo_path so Python can posix_spawn it.
+
+    Our file descriptors are non-inheritable (PEP 446), so close_fds=False
+    doesn't leak them into git.
+    """
+    return subprocess.run(git_argv(repo_path, *args), close_fds=False, **kwargs)
+
+
 def _python_key(git_key: str) -> str:
     """Convert git-style key (hyphenated) to Python-style (underscored)."""
     return git_key.replace("-", "_")
@@ -82,7 +104,18 @@ def _get_repo(repo_path: str | Path) -> Repo:
 
 
 def is_git_repo(path: str | Path) -> bool:
-    """Check if path is inside a git repository."""
+    """Check if path is inside a git repository.
+
+    Answers are cached per resolved path; init_repo clears the cache.
+    """
+    return _is_git_repo(os.fspath(Path(path).resolve()))
+
+
+@lru_cache(maxsize=128)
+def _is_git_repo(path: str) -> bool:
+    """Uncached is_git_repo, trying a plain stat of .git before GitPython."""
+    if os.path.isdir(os.path.join(path, ".git")):
+        return True
     try:
         Repo(path)
         return True
@@ -92,7 +125,9 @@ def is_git_repo(path: str | Path) -> bool:
 
 def init_repo(path: str | Path) -> Repo:
     """Initialize a new git repository at path."""
-    return Repo.init(path)
+    repo = Repo.init(path)
+    _is_git_repo.cache_clear()
+    return repo
 
 
 # --- Sync functions ---
@@ -136,13 +171,42 @@ def get_upstream(repo_path: str | Path, branch: str = "ganban") -> tuple[str, st
 
 def remote_has_branch(repo_path: str | Path, remote_name: str, branch: str = "ganban") -> bool:
     """Check if refs/remotes/{remote}/{branch} exists."""
+    return remote_tracking_commit(repo_path, remote_name, branch) is not None
+
+
+def remote_tracking_commit(repo_path: str | Path, remote_name: str, branch: str = "ganban") -> str | None:
+    """Get the commit of refs/remotes/{remote}/{branch}, or None if it doesn't exist."""
     repo = _get_repo(repo_path)
     ref = f"refs/remotes/{remote_name}/{branch}"
     try:
-        repo.git.rev_parse("--verify", ref)
-        return True
+        return repo.git.rev_parse("--verify", ref)
     except Exception:
-        return False
+        return None
+
+
+def ls_remote_sync(repo_path: str | Path, remote_name: str, branch: str = "ganban") -> str | None:
+    """Get the commit a remote advertises for a branch without fetching.
+
+    Returns None if the remote has no such branch.
+    """
+    repo = _get_repo(repo_path)
+    output = repo.git.ls_remote("--refs", remote_name, f"refs/heads/{branch}")
+    return output.split()[0] if output else None
+
+
+def fetch_if_advanced_sync(repo_path: str | Path, remote_name: str, branch: str = "ganban") -> bool:
+    """Fetch a remote and report whether its branch's tracking ref moved.
+
+    A fetch with nothing new costs one round trip, the same as asking
+    first with ls-remote, so it just fetches. --prune drops the tracking
+    ref of a branch deleted upstream, so it isn't compared against forever.
+    Runs plain `git fetch` rather than GitPython's Remote.fetch, which
+    parses FETCH_HEAD, and skips writing FETCH_HEAD entirely so fetches of
+    several remotes can run at once.
+    """
+    before = remote_tracking_commit(repo_path, remote_name, branch)
+    _get_repo(repo_path).git.fetch("--no-write-fetch-head", "--prune", remote_name)
+    return remote_tracking_commit(repo_path, remote_name, branch) != before
 
 
 # --- Async wrappers ---
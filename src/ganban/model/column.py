@@ -1,16 +1,20 @@
 """Column mutation operations for ganban boards."""
 
 import re
+from functools import lru_cache
 
 from ganban.ids import max_id, next_id
 from ganban.model.node import ListNode, Node
 from ganban.parser import first_title
 
+_NON_SLUG = re.compile(r"[^a-z0-9]+")
 
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
     slug = text.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = _NON_SLUG.sub("-", slug)
     slug = slug.strip("-")
     return slug or "untitled"
 
@@ -54,19 +58,29 @@ def move_column(board: Node, column: Node, new_index: int) -> None:
     """Move column to new_index in the board's columns ListNode.
 
     Rebuilds the columns ListNode with updated order values and dir_paths.
+    Columns ahead of the first one whose slot changed are left alone, and
+    those behind the moved range are re-added without being renumbered.
     """
-    all_cols = list(board.columns)
+    old_cols = list(board.columns)
+    all_cols = list(old_cols)
     all_cols.remove(column)
     all_cols.insert(new_index, column)
 
     old_keys = board.columns.keys()
-    for key in old_keys:
+    start = 0
+    while start < len(all_cols) and all_cols[start] is old_cols[start] and old_keys[start] == str(start + 1):
+        start += 1
+
+    for key in old_keys[start:]:
         board.columns[key] = None
 
-    for i, col in enumerate(all_cols):
-        col.order = str(i + 1)
-        col.dir_path = build_column_path(col.order, first_title(col.sections), col.hidden)
-        board.columns[col.order] = col
+    for i, col in enumerate(all_cols[start:], start):
+        order = str(i + 1)
+        # Columns after the moved range keep their slot and path
+        if col.order != order:
+            col.order = order
+            col.dir_path = build_column_path(order, first_title(col.sections), col.hidden)
+        board.columns[order] = col
 
 
 def archive_column(board: Node, column_order: str) -> None:
@@ -1,21 +1,28 @@
 """Load a ganban board from git into a Node tree."""
 
+import copy
 import re
-import subprocess
 from datetime import datetime, timezone
 from functools import cmp_to_key
 
 from git import Repo
 from git.objects import Blob, Tree
 
-from ganban.git import read_git_config
+from ganban.git import read_git_config, run_git
 from ganban.ids import compare_ids, max_id, next_id, normalize_id
 from ganban.constants import BRANCH_NAME
 from ganban.model.node import ListNode, Node
+from ganban.model.writer import mark_saved
 from ganban.parser import parse_sections
 
 MAX_COMMITS = 100
 
+# Blobs are content-addressed, so a sha always reads and parses the same way.
+MAX_BLOB_CACHE = 16384
+
+_blob_texts: dict[str, str] = {}
+_blob_sections: dict[str, tuple[list[tuple[str, str]], dict]] = {}
+
 
 def _tree_get(tree: Tree, name: str) -> Blob | Tree | None:
     """Get an item from a tree by name, returning None if not found."""
@@ -71,29 +78,53 @@ def _parse_link_name(name: str) -> tuple[str | None, str]:
     return parts
 
 
-def _build_sections_list(text: str, fallback_title: str = "Untitled") -> tuple[ListNode, dict]:
-    """Parse markdown text into a ListNode of sections plus meta dict.
+def _read_blob(blob: Blob) -> str:
+    """Read a small blob's text (a symlink target), reusing it for a blob read before."""
+    text = _blob_texts.get(blob.hexsha)
+    if text is None:
+        if len(_blob_texts) >= MAX_BLOB_CACHE:
+            _blob_texts.clear()
+        text = blob.data_stream.read().decode("utf-8")
+        _blob_texts[blob.hexsha] = text
+    return text
+
+
+def _build_sections_list(blob: Blob, fallback_title: str = "Untitled") -> tuple[ListNode, dict]:
+    """Parse a markdown blob into a ListNode of sections plus meta dict.
 
-    If the first section has no title, fallback_title is used.
+    If the first section has no title, fallback_title is used. The parse
+    of a blob seen before is reused, so reloading a board after a merge
+    only parses the files that changed.
     """
-    sections, meta = parse_sections(text)
+    parsed = _blob_sections.get(blob.hexsha)
+    if parsed is None:
+        if len(_blob_sections) >= MAX_BLOB_CACHE:
+            _blob_sections.clear()
+        parsed = parse_sections(blob.data_stream.read().decode("utf-8"))
+        _blob_sections[blob.hexsha] = parsed
+    sections, meta = parsed
     ln = ListNode()
     for i, (title, body) in enumerate(sections):
         if not title and i == 0:
             title = fallback_title
         ln.add(title, body)
-    return ln, meta
+    return ln, copy.deepcopy(meta)
 
 
 def _get_committers(repo: Repo, max_count: int = MAX_COMMITS) -> list[str]:
     """Extract unique committers from recent git history.
 
-    Returns a sorted list of "Name <email>" strings.
+    Returns a sorted list of "Name <email>" strings. git formats them
+    itself, so no commit objects are read into Python.
     """
-    seen: set[str] = set()
-    for commit in repo.iter_commits(max_count=max_count, all=True):
-        seen.add(f"{commit.author.name} <{commit.author.email}>")
-    return sorted(seen)
+    result = run_git(
+        repo.git_dir,
+        ["log", "--all", f"--max-count={max_count}", "--format=%an <%ae>"],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        return []
+    return sorted(set(result.stdout.decode("utf-8", errors="replace").splitlines()))
 
 
 def file_creation_date(repo_path: str, file_path: str, branch: str = BRANCH_NAME) -> datetime | None:
@@ -101,9 +132,9 @@ def file_creation_date(repo_path: str, file_path: str, branch: str = BRANCH_NAME
 
     Returns None if the file has no history on the branch.
     """
-    result = subprocess.run(
+    result = run_git(
+        repo_path,
         [
-            "git",
             "log",
             "--diff-filter=A",
             "--reverse",
@@ -112,7 +143,6 @@ def file_creation_date(repo_path: str, file_path: str, branch: str = BRANCH_NAME
             "--",
             file_path,
         ],
-        cwd=repo_path,
         capture_output=True,
     )
     if result.returncode != 0:
@@ -133,8 +163,7 @@ def _load_tree(tree: Tree) -> Node:
     # Root index.md
     index_blob = _tree_get(tree, "index.md")
     if index_blob is not None:
-        text = index_blob.data_stream.read().decode("utf-8")
-        sections_ln, meta = _build_sections_list(text, fallback_title="ganban")
+        sections_ln, meta = _build_sections_list(index_blob, fallback_title="ganban")
         board.sections = sections_ln
         board.meta = meta
     else:
@@ -154,8 +183,7 @@ def _load_tree(tree: Tree) -> Node:
                 continue
             card_id = normalize_id(item.name[:-3])
             card_ids.add(card_id)
-            text = item.data_stream.read().decode("utf-8")
-            sections_ln, meta = _build_sections_list(text, fallback_title=card_id)
+            sections_ln, meta = _build_sections_list(item, fallback_title=card_id)
             card = Node(
                 sections=sections_ln,
                 meta=meta,
@@ -181,8 +209,7 @@ def _load_tree(tree: Tree) -> Node:
 
         index_blob = _tree_get(col_tree, "index.md")
         if index_blob is not None:
-            text = index_blob.data_stream.read().decode("utf-8")
-            col_sections, col_meta = _build_sections_list(text, fallback_title=name)
+            col_sections, col_meta = _build_sections_list(index_blob, fallback_title=name)
         else:
             col_sections = ListNode()
             col_sections[name] = ""
@@ -200,7 +227,7 @@ def _load_tree(tree: Tree) -> Node:
             if position is None:
                 continue
             if link_item.mode == 0o120000:
-                target = link_item.data_stream.read().decode("utf-8")
+                target = _read_blob(link_item)
                 card_id = target.split("/")[-1]
                 if card_id.endswith(".md"):
                     card_id = normalize_id(card_id[:-3])
@@ -210,8 +237,7 @@ def _load_tree(tree: Tree) -> Node:
                 # Regular file: adopt as a new card
                 card_id = next_id(max_id(list(card_ids)))
                 card_ids.add(card_id)
-                text = link_item.data_stream.read().decode("utf-8")
-                sections_ln, meta = _build_sections_list(text, fallback_title=slug)
+                sections_ln, meta = _build_sections_list(link_item, fallback_title=slug)
                 card = Node(
                     sections=sections_ln,
                     meta=meta,
@@ -381,4 +407,5 @@ def load_board(repo_path: str, branch: str = BRANCH_NAME) -> Node:
     board.repo_path = str(repo_path)
     board.commit = commit.hexsha
     _activate(board, repo)
+    mark_saved(board)
     return board
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import operator
+from collections.abc import Container
 from typing import Any, Callable
 
 Callback = Callable[["Node | ListNode", str, Any, Any], None]
 
 
-def _unique_key(desired: str, existing: set[str]) -> str:
+def _unique_key(desired: str, existing: Container[str]) -> str:
     """Return desired if unused, otherwise append (1), (2), etc."""
     if desired not in existing:
         return desired
@@ -28,12 +30,18 @@ def _wrap(value: Any, parent: Node | ListNode, key: str) -> Any:
 
 
 def _emit(node: Node | ListNode, key: str, old: Any, new: Any) -> None:
-    """Fire local watchers for key, then bubble up the parent chain."""
+    """Fire local watchers for key, then bubble up the parent chain.
+
+    Also bumps _version on the node and every ancestor, so callers can
+    cheaply tell whether anything beneath a node has changed.
+    """
+    object.__setattr__(node, "_version", node._version + 1)
     for cb in node._watchers.get(key, ()):
         cb(node, key, old, new)
     child = node
     while child._parent is not None:
         parent = child._parent
+        object.__setattr__(parent, "_version", parent._version + 1)
         for cb in parent._watchers.get(child._key, ()):
             cb(node, key, old, new)
         child = parent
@@ -56,6 +64,7 @@ class Node:
     ) -> None:
         object.__setattr__(self, "_children", {})
         object.__setattr__(self, "_watchers", {})
+        object.__setattr__(self, "_version", 0)
         object.__setattr__(self, "_parent", None)
         object.__setattr__(self, "_key", _key)
         for k, v in data.items():
@@ -169,32 +178,33 @@ class ListNode:
         object.__setattr__(self, "_items", [])
         object.__setattr__(self, "_by_id", {})
         object.__setattr__(self, "_watchers", {})
+        object.__setattr__(self, "_version", 0)
         object.__setattr__(self, "_parent", _parent)
         object.__setattr__(self, "_key", _key)
 
     def __getitem__(self, key: str) -> Any:
         return self._by_id.get(str(key))
 
-    def _key_index(self, key: str) -> int:
-        """Find the index of a key in insertion order."""
-        for i, k in enumerate(self._by_id):
-            if k == key:
-                return i
-        raise KeyError(key)
+    def index(self, key: str) -> int:
+        """Return the position of key in insertion order. Raises KeyError if absent."""
+        try:
+            return operator.indexOf(self._by_id, str(key))
+        except ValueError:
+            raise KeyError(key) from None
 
     def __setitem__(self, key: str, value: Any) -> None:
         key = str(key)
         old = self._by_id.get(key)
         if value is None:
             if old is not None:
-                idx = self._key_index(key)
+                idx = self.index(key)
                 del self._items[idx]
                 del self._by_id[key]
             _emit(self, key, old, None)
         else:
             value = _wrap(value, parent=self, key=key)
             if old is not None:
-                idx = self._key_index(key)
+                idx = self.index(key)
                 self._items[idx] = value
             else:
                 self._items.append(value)
@@ -271,7 +281,7 @@ class ListNode:
 
         Returns the actual key used.
         """
-        key = _unique_key(str(key), set(self._by_id.keys()))
+        key = _unique_key(str(key), self._by_id)
         self[key] = value
         return key
 
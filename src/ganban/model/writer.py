@@ -1,29 +1,71 @@
 """Save a ganban board (Node tree) to git without touching the working tree."""
 
+import atexit
 import os
 import re
 import subprocess
 import tempfile
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
+from ganban.git import git_argv, run_git
 from ganban.ids import pad_id
 from ganban.model.column import slugify
 from ganban.constants import BRANCH_NAME
 from ganban.model.node import ListNode, Node
 from ganban.parser import first_title, serialize_sections
 
+# Refs only move on save/merge/fetch, so a short TTL lets rapid polls skip the fork.
+REF_CACHE_TTL = 1.0
+
+_ref_cache: dict[tuple[str, str], tuple[float, str | None]] = {}
+
+# Sessions are per repo; the least recently used ones are closed past this.
+MAX_SESSIONS = 8
+
+_sessions: dict[str, "GitSession"] = {}
+_sessions_lock = threading.Lock()
+
+# Commits are immutable, so commit -> tree never goes stale.
+MAX_COMMIT_TREES = 1024
+
+_commit_trees: dict[str, str] = {}
+
+# Blobs are content-addressed: once written, (repo, content) -> hash holds.
+MAX_BLOB_CACHE = 16384
+
+_blob_cache: dict[tuple[str, str], str] = {}
+
+# Merge bases remembered per session; the oldest pair is dropped past this.
+MAX_MERGE_BASES = 256
+
 
 # --- Helpers for converting Node tree back to serializable form ---
 
 
 def meta_to_dict(meta) -> dict:
-    """Convert a meta value (Node or dict) back to a plain dict, recursively."""
-    if isinstance(meta, Node):
-        return {k: meta_to_dict(v) if isinstance(v, Node) else v for k, v in meta.items()}
+    """Convert a meta value (Node or dict) back to a plain dict.
+
+    Nested Nodes are walked with an explicit stack rather than recursion.
+    """
     if isinstance(meta, dict):
         return meta
-    return {}
+    if not isinstance(meta, Node):
+        return {}
+    result: dict = {}
+    stack = [(meta, result)]
+    while stack:
+        src, dst = stack.pop()
+        for k, v in src.items():
+            if isinstance(v, Node):
+                dst[k] = child = {}
+                stack.append((v, child))
+            else:
+                dst[k] = v
+    return result
 
 
 def sections_to_text(sections: ListNode, meta) -> str:
@@ -32,30 +74,178 @@ def sections_to_text(sections: ListNode, meta) -> str:
     return serialize_sections(sections.items(), meta_dict or None)
 
 
+def _node_text(node: Node) -> str:
+    """Serialize a card, column or board Node, reusing the last result until it changes."""
+    cached = getattr(node, "_text_cache", None)
+    if cached is not None and cached[0] == node._version:
+        return cached[1]
+    text = sections_to_text(node.sections, node.meta)
+    node._text_cache = (node._version, text)
+    return text
+
+
+def _card_slug(card: Node) -> str:
+    """Slug of a card's title, reusing the last result until the card changes."""
+    cached = getattr(card, "_slug_cache", None)
+    if cached is not None and cached[0] == card._version:
+        return cached[1]
+    slug = slugify(first_title(card.sections))
+    card._slug_cache = (card._version, slug)
+    return slug
+
+
 # --- Git plumbing ---
 
 
 def _git(repo_path: Path, args: list[str]) -> str:
     """Run a git command and return stdout."""
-    result = subprocess.run(
-        ["git", *args],
-        cwd=repo_path,
-        capture_output=True,
-        check=True,
-    )
+    result = run_git(repo_path, args, capture_output=True, check=True)
     return result.stdout.decode("utf-8").strip()
 
 
-def _hash_object(repo_path: Path, content: str) -> str:
-    """Write content to git object store and return the blob hash."""
-    result = subprocess.run(
-        ["git", "hash-object", "-w", "--stdin"],
-        cwd=repo_path,
-        input=content.encode("utf-8"),
-        capture_output=True,
-        check=True,
-    )
-    return result.stdout.decode("utf-8").strip()
+class _CoProcess:
+    """A long-running git command that answers each request with one line."""
+
+    def __init__(self, repo_path: Path, args: list[str]) -> None:
+        self.repo_path = repo_path
+        self.args = args
+        self._proc: subprocess.Popen | None = None
+
+    def request(self, data: bytes) -> bytes:
+        """Write data to git's stdin and return the next line of its stdout."""
+        proc = self._proc
+        if proc is None or proc.poll() is not None:
+            proc = self._proc = subprocess.Popen(
+                git_argv(self.repo_path, *self.args),
+                close_fds=False,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        proc.stdin.write(data)
+        proc.stdin.flush()
+        line = proc.stdout.readline()
+        if not line:
+            self._proc = None
+            raise subprocess.CalledProcessError(proc.wait(), ["git", *self.args])
+        return line.rstrip(b"\n")
+
+    def close(self) -> None:
+        """Close stdin and wait for git to exit."""
+        proc, self._proc = self._proc, None
+        if proc is not None:
+            proc.stdin.close()
+            proc.wait()
+
+
+class GitSession:
+    """Persistent git helpers for one repository.
+
+    Keeps `git cat-file --batch-check`, `git update-ref --stdin` and
+    `git mktree --batch` processes open so ref lookups, ref updates and tree
+    writes don't fork a new git each time. Safe to share between threads.
+    """
+
+    def __init__(self, repo_path: str | Path) -> None:
+        self.repo_path = Path(repo_path)
+        self._lock = threading.Lock()
+        self._cat_file = _CoProcess(self.repo_path, ["cat-file", "--batch-check=%(objectname)"])
+        self._update_ref = _CoProcess(self.repo_path, ["update-ref", "--stdin"])
+        self._mktree = _CoProcess(self.repo_path, ["mktree", "--batch"])
+        # Read and written under _lock; see _get_merge_base
+        self.merge_bases: dict[tuple[str, str], str | None] = {}
+
+    def resolve(self, rev: str) -> str | None:
+        """Resolve a rev expression (ref, `sha^{tree}`, ...) to a hash, or None."""
+        with self._lock:
+            line = self._cat_file.request(rev.encode("utf-8") + b"\n")
+        # Unresolvable names come back as "<name> missing" or "<name> ambiguous"
+        if b" " in line:
+            return None
+        return line.decode("utf-8")
+
+    def update_ref(self, ref: str, new: str) -> None:
+        """Point ref at new in a `git update-ref --stdin` transaction."""
+        with self._lock:
+            self._update_ref.request(b"start\n")
+            reply = self._update_ref.request(f"update {ref} {new}\ncommit\n".encode())
+        if reply != b"commit: ok":
+            raise subprocess.CalledProcessError(1, ["git", "update-ref", ref, new], output=reply)
+
+    def mktree(self, entries: list[tuple[str, str, str, str]]) -> str:
+        """Write a tree from (mode, type, sha, name) entries and return its hash."""
+        # In --batch mode a blank line ends each tree
+        content = "".join(f"{mode} {typ} {sha}\t{name}\n" for mode, typ, sha, name in entries) + "\n"
+        with self._lock:
+            return self._mktree.request(content.encode("utf-8")).decode("utf-8")
+
+    def close(self) -> None:
+        """Shut down the helper processes."""
+        with self._lock:
+            self._cat_file.close()
+            self._update_ref.close()
+            self._mktree.close()
+
+
+def git_session(repo_path: str | Path) -> GitSession:
+    """Get the shared GitSession for a repository, starting one if needed."""
+    key = str(repo_path)
+    with _sessions_lock:
+        session = _sessions.pop(key, None) or GitSession(key)
+        _sessions[key] = session
+        while len(_sessions) > MAX_SESSIONS:
+            _sessions.pop(next(iter(_sessions))).close()
+    return session
+
+
+@atexit.register
+def close_sessions() -> None:
+    """Close every open GitSession."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+def _hash_objects(repo_path: Path, contents: list[str]) -> dict[str, str]:
+    """Write blobs to the object store with one git process.
+
+    Returns {content: blob_hash}. Duplicate contents are written once, and
+    contents already written to this repo are answered from _blob_cache
+    without touching git at all.
+    """
+    repo = str(repo_path)
+    blobs: dict[str, str] = {}
+    missing: list[str] = []
+    for content in dict.fromkeys(contents):
+        sha = _blob_cache.get((repo, content))
+        if sha is None:
+            missing.append(content)
+        else:
+            blobs[content] = sha
+    if not missing:
+        return blobs
+    with tempfile.TemporaryDirectory(prefix="ganban_blobs_") as tmp:
+        paths = []
+        for i, content in enumerate(missing):
+            path = os.path.join(tmp, str(i))
+            with open(path, "wb") as f:
+                f.write(content.encode("utf-8"))
+            paths.append(path)
+        result = run_git(
+            repo_path,
+            ["hash-object", "-w", "--no-filters", "--stdin-paths"],
+            input="\n".join(paths).encode("utf-8") + b"\n",
+            capture_output=True,
+            check=True,
+        )
+    if len(_blob_cache) + len(missing) > MAX_BLOB_CACHE:
+        _blob_cache.clear()
+    for content, sha in zip(missing, result.stdout.decode("utf-8").split(), strict=True):
+        blobs[content] = sha
+        _blob_cache[(repo, content)] = sha
+    return blobs
 
 
 def _mktree(repo_path: Path, entries: list[tuple[str, str, str, str]]) -> str:
@@ -63,17 +253,7 @@ def _mktree(repo_path: Path, entries: list[tuple[str, str, str, str]]) -> str:
 
     Each entry is (mode, type, sha, name).
     """
-    lines = [f"{mode} {typ} {sha}\t{name}" for mode, typ, sha, name in entries]
-    content = "\n".join(lines) + "\n" if lines else ""
-
-    result = subprocess.run(
-        ["git", "mktree"],
-        cwd=repo_path,
-        input=content.encode("utf-8"),
-        capture_output=True,
-        check=True,
-    )
-    return result.stdout.decode("utf-8").strip()
+    return git_session(repo_path).mktree(entries)
 
 
 def _get_branch_tip(repo_path: Path, branch: str) -> str | None:
@@ -82,32 +262,82 @@ def _get_branch_tip(repo_path: Path, branch: str) -> str | None:
 
 
 def _get_ref(repo_path: Path, ref: str) -> str | None:
-    """Get the commit hash for any ref, or None if it doesn't exist."""
-    result = subprocess.run(
-        ["git", "rev-parse", "--verify", ref],
-        cwd=repo_path,
-        capture_output=True,
-    )
-    if result.returncode != 0:
-        return None
-    return result.stdout.decode("utf-8").strip()
+    """Get the commit hash for any ref, or None if it doesn't exist.
+
+    Results are cached for REF_CACHE_TTL seconds per (repo, ref).
+    """
+    key = (str(repo_path), ref)
+    now = time.monotonic()
+    cached = _ref_cache.get(key)
+    if cached is not None and now - cached[0] < REF_CACHE_TTL:
+        return cached[1]
+    sha = git_session(repo_path).resolve(ref)
+    _ref_cache[key] = (now, sha)
+    return sha
+
+
+def _commit_tree(repo_path: Path, commit: str) -> str | None:
+    """Get the tree hash of a commit, or None if it can't be resolved."""
+    tree = _commit_trees.get(commit)
+    if tree is None:
+        tree = git_session(repo_path).resolve(f"{commit}^{{tree}}")
+        if tree is not None:
+            _remember_commit_tree(commit, tree)
+    return tree
+
+
+def _remember_commit_tree(commit: str, tree: str) -> None:
+    """Record a commit's tree so later saves can compare without asking git."""
+    if len(_commit_trees) >= MAX_COMMIT_TREES:
+        _commit_trees.clear()
+    _commit_trees[commit] = tree
 
 
+def _update_branch(repo_path: Path, branch: str, commit: str) -> None:
+    """Move a branch to commit and drop stale cached refs."""
+    git_session(repo_path).update_ref(f"refs/heads/{branch}", commit)
+    invalidate_ref_cache(repo_path)
+
+
+def invalidate_ref_cache(repo_path: str | Path) -> None:
+    """Forget cached ref lookups for a repo, e.g. after a fetch or ref update."""
+    repo = str(repo_path)
+    for key in [k for k in _ref_cache if k[0] == repo]:
+        _ref_cache.pop(key, None)
+
+
+@lru_cache(maxsize=1024)
 def _commit_timestamp(repo_path: Path, commit: str) -> int:
     """Get the committer timestamp of a commit as epoch seconds."""
     return int(_git(repo_path, ["log", "-1", "--format=%ct", commit]))
 
 
 def _get_merge_base(repo_path: Path, commit1: str, commit2: str) -> str | None:
-    """Find the merge base of two commits, or None if no common ancestor."""
-    result = subprocess.run(
-        ["git", "merge-base", commit1, commit2],
-        cwd=repo_path,
+    """Find the merge base of two commits, or None if no common ancestor.
+
+    Commits are immutable, so answers are remembered on the GitSession and
+    later sync cycles with the same pair of commits don't fork git again.
+    """
+    session = git_session(repo_path)
+    merge_bases = session.merge_bases
+    key = (commit1, commit2) if commit1 <= commit2 else (commit2, commit1)
+    # Remote checks run in parallel threads, so touch the dict under the session lock
+    with session._lock:
+        if key in merge_bases:
+            return merge_bases[key]
+    result = run_git(
+        repo_path,
+        ["merge-base", commit1, commit2],
         capture_output=True,
     )
-    if result.returncode != 0:
-        return None
-    return result.stdout.decode("utf-8").strip()
+    base = result.stdout.decode("utf-8").strip() if result.returncode == 0 else None
+    # Exit 1 means "no common ancestor"; anything else (e.g. a missing object) may change later
+    if result.returncode in (0, 1):
+        with session._lock:
+            if len(merge_bases) >= MAX_MERGE_BASES:
+                merge_bases.pop(next(iter(merge_bases)), None)
+            merge_bases[key] = base
+    return base
 
 
 def _merge_trees(
@@ -121,12 +351,21 @@ def _merge_trees(
     Returns:
         Tuple of (merged_tree_hash, conflict_paths).
         conflict_paths is empty on a clean merge.
+
+    When either side's tree leaves nothing to combine (theirs is unchanged
+    from the base, or both sides already agree) our tree is returned
+    without running git.
     """
+    their_tree = _commit_tree(repo_path, their_commit)
+    # An unresolvable tree proves nothing; let merge-tree have the final say
+    if their_tree is not None and (their_tree == our_tree or their_tree == _commit_tree(repo_path, base_commit)):
+        return our_tree, []
+
     our_temp_commit = _git(repo_path, ["commit-tree", our_tree, "-p", base_commit, "-m", "temp merge commit"])
 
-    result = subprocess.run(
-        ["git", "merge-tree", "--write-tree", f"--merge-base={base_commit}", our_temp_commit, their_commit],
-        cwd=repo_path,
+    result = run_git(
+        repo_path,
+        ["merge-tree", "--write-tree", f"--merge-base={base_commit}", our_temp_commit, their_commit],
         capture_output=True,
     )
 
@@ -148,12 +387,12 @@ def _resolve_conflicts(repo_path: Path, merged_tree: str, winner_commit: str, co
     os.close(fd)
     try:
         env = {**os.environ, "GIT_INDEX_FILE": idx}
-        subprocess.run(["git", "read-tree", merged_tree], cwd=repo_path, env=env, check=True)
+        run_git(repo_path, ["read-tree", merged_tree], env=env, check=True)
         for path in conflict_paths:
             # Get the entry (mode + blob) from the winner's tree
-            entry = subprocess.run(
-                ["git", "ls-tree", winner_commit, path],
-                cwd=repo_path,
+            entry = run_git(
+                repo_path,
+                ["ls-tree", winner_commit, path],
                 capture_output=True,
             )
             entry_line = entry.stdout.decode("utf-8").strip()
@@ -161,23 +400,23 @@ def _resolve_conflicts(repo_path: Path, merged_tree: str, winner_commit: str, co
                 # File exists in winner: replace the blob
                 mode, _, blob = entry_line.split(None, 2)
                 blob = blob.split("\t")[0]
-                subprocess.run(
-                    ["git", "update-index", "--cacheinfo", f"{mode},{blob},{path}"],
-                    cwd=repo_path,
+                run_git(
+                    repo_path,
+                    ["update-index", "--cacheinfo", f"{mode},{blob},{path}"],
                     env=env,
                     check=True,
                 )
             else:
                 # File deleted in winner: remove from index
-                subprocess.run(
-                    ["git", "update-index", "--force-remove", path],
-                    cwd=repo_path,
+                run_git(
+                    repo_path,
+                    ["update-index", "--force-remove", path],
                     env=env,
                     check=True,
                 )
-        result = subprocess.run(
-            ["git", "write-tree"],
-            cwd=repo_path,
+        result = run_git(
+            repo_path,
+            ["write-tree"],
             env=env,
             capture_output=True,
             check=True,
@@ -191,54 +430,46 @@ def _resolve_conflicts(repo_path: Path, merged_tree: str, winner_commit: str, co
 
 
 def _build_board_tree(repo_path: Path, board: Node) -> str:
-    """Build the complete git tree for a board and return its hash."""
-    # Build card blobs and .all tree
-    width = max(max((len(cid) for cid in board.cards.keys()), default=1), 3)
-    card_entries = []
-    for card_id, card in board.cards.items():
-        text = sections_to_text(card.sections, card.meta)
-        blob = _hash_object(repo_path, text)
-        card_entries.append(("100644", "blob", blob, f"{pad_id(card_id, width)}.md"))
+    """Build the complete git tree for a board and return its hash.
 
-    all_tree = _mktree(repo_path, card_entries)
-
-    # Build column trees
-    column_trees = []
-    for col in board.columns:
-        col_tree = _build_column_tree(repo_path, col, board, width)
-        column_trees.append((col.dir_path, col_tree))
+    Every blob is collected up front and written by a single
+    `git hash-object` process before the trees are assembled.
+    """
+    width = max(max((len(cid) for cid in board.cards.keys()), default=1), 3)
+    card_files = [("100644", f"{pad_id(card_id, width)}.md", _node_text(card)) for card_id, card in board.cards.items()]
+    column_files = [(col.dir_path, _column_files(col, board, width)) for col in board.columns]
+    index_text = _node_text(board)
 
-    # Build root tree entries
-    root_entries = [("040000", "tree", all_tree, ".all")]
+    contents = [text for _, _, text in card_files]
+    for _, files in column_files:
+        contents.extend(text for _, _, text in files)
+    contents.append(index_text)
+    blobs = _hash_objects(repo_path, contents)
 
-    for dir_path, tree_sha in column_trees:
-        root_entries.append(("040000", "tree", tree_sha, dir_path))
+    def tree(files: list[tuple[str, str, str]]) -> str:
+        return _mktree(repo_path, [(mode, "blob", blobs[text], name) for mode, name, text in files])
 
-    index_blob = _hash_object(repo_path, sections_to_text(board.sections, board.meta))
-    root_entries.append(("100644", "blob", index_blob, "index.md"))
+    root_entries = [("040000", "tree", tree(card_files), ".all")]
+    for dir_path, files in column_files:
+        root_entries.append(("040000", "tree", tree(files), dir_path))
+    root_entries.append(("100644", "blob", blobs[index_text], "index.md"))
 
     return _mktree(repo_path, root_entries)
 
 
-def _build_column_tree(repo_path: Path, col: Node, board: Node, width: int = 3) -> str:
-    """Build a git tree for a column directory."""
-    entries = []
-
-    index_blob = _hash_object(repo_path, sections_to_text(col.sections, col.meta))
-    entries.append(("100644", "blob", index_blob, "index.md"))
+def _column_files(col: Node, board: Node, width: int = 3) -> list[tuple[str, str, str]]:
+    """List a column directory's files as (mode, name, content)."""
+    files = [("100644", "index.md", _node_text(col))]
 
     # Add symlinks for card links
     for i, card_id in enumerate(col.links):
         card = board.cards[card_id]
-        title = first_title(card.sections) if card else ""
-        slug = slugify(title)
+        slug = _card_slug(card) if card else slugify("")
         position = f"{i + 1:02d}"
         target = f"../.all/{pad_id(card_id, width)}.md"
-        symlink_blob = _hash_object(repo_path, target)
-        filename = f"{position}.{slug}.md"
-        entries.append(("120000", "blob", symlink_blob, filename))
+        files.append(("120000", f"{position}.{slug}.md", target))
 
-    return _mktree(repo_path, entries)
+    return files
 
 
 # --- Public API ---
@@ -262,6 +493,8 @@ def save_board(
     """Save a board to git and return the new commit hash."""
     repo_path = Path(board.repo_path)
 
+    # Taken before serializing, so edits made while we save still count as unsaved
+    stamp = _content_stamp(board)
     tree = _build_board_tree(repo_path, board)
 
     if parents is None:
@@ -272,10 +505,9 @@ def save_board(
             parents = [current_tip] if current_tip else []
 
     # Skip commit if tree is unchanged from parent
-    if len(parents) == 1 and parents[0]:
-        parent_tree = _git(repo_path, ["rev-parse", f"{parents[0]}^{{tree}}"])
-        if parent_tree == tree:
-            return board.commit
+    if len(parents) == 1 and parents[0] and _commit_tree(repo_path, parents[0]) == tree:
+        board._saved_stamp = stamp
+        return board.commit
 
     parent_args = []
     for parent in parents:
@@ -287,11 +519,32 @@ def save_board(
         ["commit-tree", tree, *parent_args, "-m", message],
     )
 
-    _git(repo_path, ["update-ref", f"refs/heads/{branch}", new_commit])
+    _update_branch(repo_path, branch, new_commit)
+    _remember_commit_tree(new_commit, tree)
+    board._saved_stamp = stamp
 
     return new_commit
 
 
+def _content_stamp(board: Node) -> tuple:
+    """Identity and version of each part of the board that save_board writes.
+
+    Sync status and other transient state under board.git are left out.
+    """
+    parts = (board.sections, board.meta, board.cards, board.columns)
+    return tuple((part, part._version if part is not None else None) for part in parts)
+
+
+def mark_saved(board: Node) -> None:
+    """Record the board's current content as matching what's in git."""
+    board._saved_stamp = _content_stamp(board)
+
+
+def has_unsaved_changes(board: Node) -> bool:
+    """Whether the board changed since it was last loaded or saved."""
+    return getattr(board, "_saved_stamp", None) != _content_stamp(board)
+
+
 def _check_divergence(
     repo_path: Path,
     our_commit: str,
@@ -344,9 +597,8 @@ def try_auto_merge(
     our_tree = _build_board_tree(repo_path, board)
 
     # Fast-forward: our tree matches the merge base, so we're just behind
-    base_tree = _git(repo_path, ["rev-parse", f"{merge_info.base}^{{tree}}"])
-    if our_tree == base_tree:
-        _git(repo_path, ["update-ref", f"refs/heads/{branch}", merge_info.theirs])
+    if our_tree == _commit_tree(repo_path, merge_info.base):
+        _update_branch(repo_path, branch, merge_info.theirs)
         return merge_info.theirs
 
     merged_tree, conflict_paths = _merge_trees(repo_path, merge_info.base, our_tree, merge_info.theirs)
@@ -366,6 +618,7 @@ def try_auto_merge(
         ["commit-tree", merged_tree, *parent_args, "-m", message],
     )
 
-    _git(repo_path, ["update-ref", f"refs/heads/{branch}", new_commit])
+    _update_branch(repo_path, branch, new_commit)
+    _remember_commit_tree(new_commit, merged_tree)
 
     return new_commit
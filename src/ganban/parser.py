@@ -1,10 +1,28 @@
 """Parse markdown documents with front-matter."""
 
+import copy
 import re
+from functools import lru_cache
 
 import yaml
 
-_H1_OR_H2 = re.compile(r"^(#{1,2}) ", re.MULTILINE)
+# libyaml's C emitter when PyYAML was built with it, else the pure-Python one.
+# Loading stays on the pure-Python SafeLoader: libyaml accepts some malformed
+# blocks it rejects, which would make a card's meta depend on the PyYAML build.
+_FastDumper = getattr(yaml, "CDumper", yaml.Dumper)
+
+# A whole fenced block (up to its closing fence line, or the end of the
+# text if unclosed) or an h1/h2 marker at the start of a line.
+_FENCE_OR_H1_H2 = re.compile(r"^```.*?(?:^```[^\n]*|\Z)|^#{1,2} ", re.MULTILINE | re.DOTALL)
+
+# Same fence handling, but matching whole h1/h2 heading lines for parsing.
+_FENCE_OR_HEADING = re.compile(r"^```.*?(?:^```[^\n]*|\Z)|^##? [^\n]*", re.MULTILINE | re.DOTALL)
+
+
+def _demote_match(match: re.Match) -> str:
+    """Leave fenced blocks untouched, rewrite heading markers to ###."""
+    text = match.group()
+    return text if text[0] == "`" else "### "
 
 
 def _demote_headings(text: str) -> str:
@@ -12,15 +30,7 @@ def _demote_headings(text: str) -> str:
 
     Skips lines inside fenced code blocks.
     """
-    result = []
-    in_fence = False
-    for line in text.split("\n"):
-        if line.startswith("```"):
-            in_fence = not in_fence
-        if not in_fence:
-            line = _H1_OR_H2.sub("### ", line)
-        result.append(line)
-    return "\n".join(result)
+    return _FENCE_OR_H1_H2.sub(_demote_match, text)
 
 
 def parse_sections(text: str) -> tuple[list[tuple[str, str]], dict]:
@@ -33,39 +43,29 @@ def parse_sections(text: str) -> tuple[list[tuple[str, str]], dict]:
     - meta is the front-matter dict (or {})
     """
     text, meta = _extract_front_matter(text)
-    lines = text.split("\n")
 
     sections: list[tuple[str, str]] = []
-    current_title: str | None = None
-    current_lines: list[str] = []
-    preamble_lines: list[str] = []
-    in_heading = False
-    in_code_fence = False
-
-    for line in lines:
-        if line.startswith("```"):
-            in_code_fence = not in_code_fence
-        if not in_code_fence and (line.startswith("# ") or line.startswith("## ")):
-            if in_heading:
-                sections.append((current_title or "", "\n".join(current_lines).strip()))
-            is_h1 = line.startswith("# ") and not line.startswith("## ")
-            current_title = line[2:].strip() if is_h1 else line[3:].strip()
-            current_lines = []
-            in_heading = True
+    title: str | None = None
+    body_start = 0
+
+    for match in _FENCE_OR_HEADING.finditer(text):
+        line = match.group()
+        if line[0] == "`":
             continue
-        if in_heading:
-            current_lines.append(line)
+        if title is None:
+            # Prepend preamble as ("", body) if there was text before the first heading
+            preamble = text[: match.start()].strip()
+            if preamble:
+                sections.append(("", preamble))
         else:
-            preamble_lines.append(line)
-
-    if in_heading:
-        # Prepend preamble as ("", body) if there was text before the first heading
-        preamble = "\n".join(preamble_lines).strip()
-        if preamble:
-            sections.insert(0, ("", preamble))
-        sections.append((current_title or "", "\n".join(current_lines).strip()))
+            sections.append((title, text[body_start : match.start()].strip()))
+        title = line[3:].strip() if line.startswith("## ") else line[2:].strip()
+        body_start = match.end()
+
+    if title is None:
+        sections.append(("", text.strip()))
     else:
-        sections.append(("", "\n".join(preamble_lines).strip()))
+        sections.append((title, text[body_start:].strip()))
 
     return sections, meta
 
@@ -80,7 +80,7 @@ def serialize_sections(sections: list[tuple[str, str]], meta: dict | None = None
 
     if meta:
         parts.append("---")
-        parts.append(yaml.dump(meta, default_flow_style=False, sort_keys=False).rstrip())
+        parts.append(_dump_yaml(meta).rstrip())
         parts.append("---")
         parts.append("")
 
@@ -96,6 +96,33 @@ def serialize_sections(sections: list[tuple[str, str]], meta: dict | None = None
     return "\n".join(parts).rstrip() + "\n"
 
 
+def _has_escaped_strings(meta: dict) -> bool:
+    """Check whether any key or value is a string YAML would need to escape."""
+    stack: list = [meta]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, str):
+            if not (value.isascii() and value.isprintable()):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def _dump_yaml(meta: dict) -> str:
+    """Dump front-matter, using libyaml's emitter where it's byte-identical.
+
+    libyaml folds long escaped strings at different points to PyYAML's
+    emitter, so metas containing any go through the pure-Python dumper.
+    Otherwise a card's bytes would depend on how PyYAML was installed.
+    """
+    dumper = yaml.Dumper if _has_escaped_strings(meta) else _FastDumper
+    return yaml.dump(meta, Dumper=dumper, default_flow_style=False, sort_keys=False)
+
+
 def first_title(sections) -> str:
     """Get the title (first key) of a sections ListNode, or empty string."""
     keys = sections.keys()
@@ -125,8 +152,19 @@ def _extract_front_matter(text: str) -> tuple[str, dict]:
     remaining = text[match.end() :]
 
     try:
-        meta = yaml.safe_load(yaml_content) or {}
+        meta = _load_yaml(yaml_content)
     except yaml.YAMLError:
-        meta = {}
+        meta = None
+    # Only a mapping counts as front-matter
+    meta = copy.deepcopy(meta) if isinstance(meta, dict) else {}
 
     return remaining, meta
+
+
+@lru_cache(maxsize=1024)
+def _load_yaml(content: str):
+    """Parse a front-matter block, memoized on its text.
+
+    Callers must copy the result: it's shared between every hit.
+    """
+    return yaml.safe_load(content)
@@ -7,16 +7,16 @@ import asyncio
 import logging
 
 from ganban.git import (
-    fetch_sync,
+    fetch_if_advanced_sync,
     get_remotes_sync,
     get_upstream,
     push_sync,
-    remote_has_branch,
 )
 from ganban.model.loader import load_board
 from ganban.model.writer import (
     check_for_merge,
     check_remote_for_merge,
+    invalidate_ref_cache,
     save_board,
     try_auto_merge,
 )
@@ -24,6 +24,15 @@ from ganban.model.writer import (
 logger = logging.getLogger(__name__)
 
 
+async def _fetch(repo_path, remote):
+    """Fetch one remote if it has moved, logging failures. Returns True if fetched."""
+    try:
+        return await asyncio.to_thread(fetch_if_advanced_sync, repo_path, remote)
+    except Exception as exc:
+        logger.warning("fetch %s failed: %s", remote, exc)
+        return False
+
+
 async def run_sync_cycle(board):
     """Run one sync cycle: pull → save → merge → load → push.
 
@@ -53,11 +62,9 @@ async def run_sync_cycle(board):
                 else:
                     upstream_remote = remotes[0]
 
-                for remote in remotes:
-                    try:
-                        await asyncio.to_thread(fetch_sync, repo_path, remote)
-                    except Exception as exc:
-                        logger.warning("fetch %s failed: %s", remote, exc)
+                fetched = await asyncio.gather(*(_fetch(repo_path, remote) for remote in remotes))
+                if any(fetched):
+                    invalidate_ref_cache(repo_path)
 
         # --- SAVE (commit in-memory state to git) ---
         if do_local:
@@ -85,13 +92,18 @@ async def run_sync_cycle(board):
                 merge_order = [r for r in remotes if r != upstream_remote] + (
                     [upstream_remote] if upstream_remote else []
                 )
-                for remote in merge_order:
-                    has_branch = await asyncio.to_thread(remote_has_branch, repo_path, remote)
-                    if not has_branch:
-                        continue
-                    merge_info = await asyncio.to_thread(check_remote_for_merge, board, remote)
+                # Check every remote at once; a missing tracking branch just yields None
+                checks = await asyncio.gather(
+                    *(asyncio.to_thread(check_remote_for_merge, board, remote) for remote in merge_order)
+                )
+                for remote, merge_info in zip(merge_order, checks, strict=True):
                     if merge_info is None:
                         continue
+                    if merge_info.ours != board.commit:
+                        # An earlier merge moved us on, so re-check against the new commit
+                        merge_info = await asyncio.to_thread(check_remote_for_merge, board, remote)
+                        if merge_info is None:
+                            continue
                     new_commit = await asyncio.to_thread(
                         try_auto_merge,
                         board,
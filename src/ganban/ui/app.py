@@ -1,19 +1,26 @@
 """Main Textual application for ganban."""
 
+import asyncio
+import logging
 from pathlib import Path
 
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
-from textual.widgets import Button, Static
+from textual.widgets import Button, LoadingIndicator, Static
 
 from ganban.git import has_branch, init_repo, is_git_repo
 from ganban.model.loader import load_board
 from ganban.model.node import ListNode, Node
 from ganban.model.column import create_column
-from ganban.model.writer import save_board
+from ganban.model.writer import has_unsaved_changes, save_board
 from ganban.ui.board import BoardScreen
 
+logger = logging.getLogger(__name__)
+
+# How long quitting waits on the final save before closing the UI anyway
+QUIT_SAVE_TIMEOUT = 5.0
+
 
 class ConfirmInitScreen(ModalScreen[bool]):
     """Modal screen asking to initialize a git repo."""
@@ -36,36 +43,18 @@ class ConfirmInitScreen(ModalScreen[bool]):
 class GanbanApp(App):
     """Git-based kanban board TUI."""
 
+    # Sheets for widgets that only live in the detail modal are loaded by
+    # DetailModal when it's first opened.
     CSS_PATH = [
         "app.tcss",
         "board.tcss",
         "card.tcss",
         "column.tcss",
-        "detail.tcss",
         "menu.tcss",
         "drag.tcss",
-        "users.tcss",
-        "done.tcss",
-        "due.tcss",
-        "confirm.tcss",
-        "assignee.tcss",
-        "deps.tcss",
-        "labels.tcss",
-        "labels_editor.tcss",
         "color.tcss",
         "sync_widget.tcss",
-        "cal.tcss",
-        "emoji.tcss",
-        "tag.tcss",
-        "search.tcss",
         "edit/editable.tcss",
-        "edit/section.tcss",
-        "edit/viewers.tcss",
-        "edit/meta.tcss",
-        "edit/document.tcss",
-        "edit/comments.tcss",
-        "edit/tasks.tcss",
-        "edit/completion.tcss",
     ]
 
     TITLE = "ganban"
@@ -77,6 +66,10 @@ class GanbanApp(App):
         self.repo_path = repo_path
         self.board: Node | None = None
 
+    def compose(self) -> ComposeResult:
+        # Shown until the board has loaded and its screen is pushed on top
+        yield LoadingIndicator()
+
     async def on_mount(self) -> None:
         if not is_git_repo(self.repo_path):
             self.push_screen(ConfirmInitScreen(self.repo_path), self._on_init_response)
@@ -85,33 +78,56 @@ class GanbanApp(App):
 
     async def _on_init_response(self, result: bool) -> None:
         if result:
-            init_repo(self.repo_path)
+            await asyncio.to_thread(init_repo, self.repo_path)
             await self._load_board()
         else:
             self.exit()
 
     async def _load_board(self) -> None:
-        """Load or create the board and show it."""
+        """Load or create the board and show it.
+
+        The git work runs in a thread so the event loop stays responsive.
+        """
         if not await has_branch(self.repo_path):
-            board = Node(repo_path=str(self.repo_path))
-            board.sections = ListNode()
-            board.sections[self.repo_path.name] = ""
-            board.meta = {}
-            board.cards = ListNode()
-            board.columns = ListNode()
-            create_column(board, "Backlog", order="1")
-            create_column(board, "Doing", order="2")
-            create_column(board, "Done", order="3")
-            save_board(board, message="Initialize ganban board")
-
-        self.board = load_board(str(self.repo_path))
+            await asyncio.to_thread(self._seed_board)
+
+        self.board = await asyncio.to_thread(load_board, str(self.repo_path))
         self.push_screen(BoardScreen(self.board))
 
-    def action_quit(self) -> None:
-        """Cancel sync, save and quit."""
-        screen = self.screen
-        if hasattr(screen, "_sync_task") and screen._sync_task is not None:
-            screen._sync_task.cancel()
-        if self.board:
-            save_board(self.board)
+    def _seed_board(self) -> None:
+        """Commit a new board with the default columns."""
+        board = Node(repo_path=str(self.repo_path))
+        board.sections = ListNode()
+        board.sections[self.repo_path.name] = ""
+        board.meta = {}
+        board.cards = ListNode()
+        board.columns = ListNode()
+        create_column(board, "Backlog", order="1")
+        create_column(board, "Doing", order="2")
+        create_column(board, "Done", order="3")
+        save_board(board, message="Initialize ganban board")
+
+    async def action_quit(self) -> None:
+        """Let sync finish, save and quit.
+
+        A running sync cycle or ctrl+s save can't be stopped once its git
+        work is in a thread, so it gets QUIT_SAVE_TIMEOUT to finish. If it
+        doesn't, the UI closes without a final save rather than race it.
+        The save runs in a thread so the UI keeps drawing. If it takes
+        longer than QUIT_SAVE_TIMEOUT the UI closes anyway and the save
+        finishes before the process exits.
+        """
+        screen = next((s for s in self.screen_stack if isinstance(s, BoardScreen)), None)
+        if screen is not None:
+            try:
+                await asyncio.wait_for(screen.wait_for_git(), QUIT_SAVE_TIMEOUT)
+            except TimeoutError:
+                logger.warning("sync or save still running after %ss, closing anyway", QUIT_SAVE_TIMEOUT)
+                self.exit()
+                return
+        if self.board and has_unsaved_changes(self.board):
+            try:
+                await asyncio.wait_for(asyncio.to_thread(save_board, self.board), QUIT_SAVE_TIMEOUT)
+            except TimeoutError:
+                logger.warning("save still running after %ss, closing anyway", QUIT_SAVE_TIMEOUT)
         self.exit()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from textual.app import ComposeResult
@@ -30,12 +31,33 @@ def resolve_assignee(assigned: str, board: Node) -> tuple[str, str, str]:
     return emoji_for_email(email), parsed_name, email
 
 
+def _cached_options(board: Node, name: str, build: Callable[[Node], list[tuple[str, str]]]) -> list[tuple[str, str]]:
+    """Return build(board), reused until board users or committers change.
+
+    The result is cached on the board under name, stamped with the users
+    node's version and the committers list.
+    """
+    users = board.meta.users if board.meta else None
+    committers = board.git.committers if board.git else None
+    stamp = (users, users._version if users is not None else None, committers)
+    cached = getattr(board, name, None)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, build(board))
+        setattr(board, name, cached)
+    return list(cached[1])
+
+
 def build_assignee_options(board: Node) -> list[tuple[str, str]]:
     """Build options for the assignee SearchInput from board users and git committers.
 
     Returns (label, value) tuples where label includes emoji and value is the
     committer string.
     """
+    return _cached_options(board, "_assignee_options", _assignee_options)
+
+
+def _assignee_options(board: Node) -> list[tuple[str, str]]:
+    """Uncached build_assignee_options."""
     options: list[tuple[str, str]] = []
     seen: set[str] = set()
 
@@ -67,6 +89,11 @@ def build_mention_options(board: Node) -> list[tuple[str, str]]:
 
     Returns (label, value) tuples where value is ``[Name](mailto:email)``.
     """
+    return _cached_options(board, "_mention_options", _mention_options)
+
+
+def _mention_options(board: Node) -> list[tuple[str, str]]:
+    """Uncached build_mention_options."""
     options: list[tuple[str, str]] = []
     seen: set[str] = set()
 
@@ -105,47 +132,56 @@ class AssigneeWidget(NodeWatcherMixin, Container):
         super().__init__(**kwargs)
         self.meta = meta
         self.board = board
+        # Kept from compose so keystroke handlers don't query the DOM
+        self._bar: Horizontal | None = None
+        self._picker: Static | None = None
 
     def compose(self) -> ComposeResult:
         assigned = self.meta.assigned
         if assigned:
-            emoji, _, _ = resolve_assignee(assigned, self.board)
+            emoji, name, _ = resolve_assignee(assigned, self.board)
         else:
             emoji = ICON_PERSON
-        with Horizontal(id="assignee-bar"):
-            yield Static(emoji, id="assignee-picker")
+        with Horizontal(id="assignee-bar") as self._bar:
+            self._picker = Static(emoji, id="assignee-picker")
+            yield self._picker
             if assigned:
-                _, name, _ = resolve_assignee(assigned, self.board)
                 yield Tag(value=assigned, display=name, classes="assignee-tag")
 
     def on_mount(self) -> None:
         self.node_watch(self.meta, "assigned", self._on_assigned_changed)
 
     def _on_assigned_changed(self, source_node: Any, key: str, old: Any, new: Any) -> None:
-        self.call_later(self._rebuild_tag)
+        self.call_later_once(self._rebuild_tag)
 
     def _rebuild_tag(self) -> None:
-        """Rebuild the assignee tag to match current meta."""
-        bar = self.query_one("#assignee-bar", Horizontal)
-        for tag in list(bar.query(Tag)):
-            tag.remove()
-        picker = self.query_one("#assignee-picker", Static)
+        """Update the assignee tag in place to match current meta."""
+        tags = list(self._bar.query_children(Tag))
         assigned = self.meta.assigned
-        if assigned:
-            emoji, name, _ = resolve_assignee(assigned, self.board)
-            picker.update(emoji)
-            bar.mount(Tag(value=assigned, display=name, classes="assignee-tag"))
-        else:
-            picker.update(ICON_PERSON)
+        if not assigned:
+            for tag in tags:
+                tag.remove()
+            self._picker.update(ICON_PERSON)
+            return
+        emoji, name, _ = resolve_assignee(assigned, self.board)
+        self._picker.update(emoji)
+        if not tags:
+            self._bar.mount(Tag(value=assigned, display=name, classes="assignee-tag"))
+            return
+        for extra in tags[1:]:
+            extra.remove()
+        tag = tags[0]
+        tag.value = assigned
+        tag.remove_class("-new")
+        tag.update_display(name)
 
     def _update_picker_emoji(self, text: str) -> None:
         """Update the emoji icon based on text being typed."""
-        picker = self.query_one("#assignee-picker", Static)
         if text.strip():
             emoji, _, _ = resolve_assignee(text, self.board)
-            picker.update(emoji)
+            self._picker.update(emoji)
         else:
-            picker.update(ICON_PERSON)
+            self._picker.update(ICON_PERSON)
 
     def on_click(self, event) -> None:
         event.stop()
@@ -162,12 +198,11 @@ class AssigneeWidget(NodeWatcherMixin, Container):
         """Start editing — reuse existing tag or create a new one."""
         options = build_assignee_options(self.board)
         if tag is None:
-            tags = list(self.query_one("#assignee-bar", Horizontal).query(Tag))
+            tags = list(self._bar.query_children(Tag))
             tag = tags[0] if tags else None
         if tag is None:
-            bar = self.query_one("#assignee-bar", Horizontal)
             tag = Tag(value="", classes="assignee-tag -new")
-            bar.mount(tag)
+            self._bar.mount(tag)
         tag.start_editing(options)
 
     def on_tag_changed(self, event: Tag.Changed) -> None:
@@ -178,7 +213,7 @@ class AssigneeWidget(NodeWatcherMixin, Container):
         with self.suppressing():
             self.meta.assigned = new_value
         emoji, name, _ = resolve_assignee(new_value, self.board)
-        self.query_one("#assignee-picker", Static).update(emoji)
+        self._picker.update(emoji)
         tag.update_display(name)
 
     def on_tag_deleted(self, event: Tag.Deleted) -> None:
@@ -187,7 +222,7 @@ class AssigneeWidget(NodeWatcherMixin, Container):
         tag.remove()
         with self.suppressing():
             self.meta.assigned = None
-        self.query_one("#assignee-picker", Static).update(ICON_PERSON)
+        self._picker.update(ICON_PERSON)
 
     def on_input_changed(self, event: Input.Changed) -> None:
         event.stop()
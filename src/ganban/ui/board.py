@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from bisect import bisect_right
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal
@@ -13,20 +14,30 @@ from ganban.model.card import archive_card, move_card
 from ganban.model.column import archive_column, move_column
 from ganban.model.node import Node
 from ganban.git import write_git_config_key
-from ganban.model.writer import save_board
+from ganban.model.writer import has_unsaved_changes, save_board
 from ganban.parser import first_title
 from ganban.sync import run_sync_cycle
 from ganban.ui.card import AddCard, CardWidget
 from ganban.ui.column import AddColumn, ColumnWidget
 from ganban.ui.constants import ICON_BOARD, ICON_EDIT, ICON_SETTINGS
 from ganban.ui.detail import BoardDetailModal
-from ganban.ui.drag import ColumnPlaceholder, DropTarget
+from ganban.ui.drag import ColumnPlaceholder, DropTarget, is_just_before, reorder_children
 from ganban.ui.edit import EditableText, TextEditor
 from ganban.ui.menu import ContextMenu, MenuItem, MenuSeparator
 from ganban.ui.static import CloseButton
 from ganban.ui.sync_widget import SyncWidget
 from ganban.ui.watcher import NodeWatcherMixin
 
+# Shortest gap between sync cycles, used after a cycle that moved the board
+MIN_SYNC_INTERVAL = 2.0
+# Seconds without edits before an edit is synced
+EDIT_QUIET_PERIOD = 2.0
+
+
+def _mid_x(widget) -> int:
+    region = widget.region
+    return region.x + region.width // 2
+
 
 class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
     """Main board screen showing all columns."""
@@ -42,9 +53,20 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         super().__init__()
         self.board = board
         self._active_draggable = None
+        self._drag_pos: tuple[int, int] = (0, 0)
         self._column_placeholder: ColumnPlaceholder | None = None
+        # The widget the placeholder was last put in front of
+        self._placeholder_before: Static | None = None
+        # Kept from compose; querying for it walks every card on the board
+        self._columns: Horizontal | None = None
+        self._header: EditableText | None = None
+        self._settings: Static | None = None
+        self._add_column: AddColumn | None = None
         self._sync_task: asyncio.Task | None = None
+        self._save_lock = asyncio.Lock()
         self._last_sync: float = time.monotonic()
+        self._sync_delay: float | None = None
+        self._last_edit: float | None = None
 
         # Initialize transient sync status (not persisted)
         if not board.git:
@@ -54,29 +76,33 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
     def compose(self) -> ComposeResult:
         title = first_title(self.board.sections)
         with Horizontal(id="board-header"):
-            yield EditableText(title, Static(title), TextEditor(), id="board-title")
-            yield Static(ICON_SETTINGS, id="board-settings")
+            self._header = EditableText(title, Static(title), TextEditor(), id="board-title")
+            yield self._header
+            self._settings = Static(ICON_SETTINGS, id="board-settings")
+            yield self._settings
             yield SyncWidget(self.board, id="sync-status")
             yield CloseButton()
 
         visible_columns = [c for c in self.board.columns if not c.hidden]
 
-        with Horizontal(id="columns"):
+        with Horizontal(id="columns") as self._columns:
             for column in visible_columns:
                 yield ColumnWidget(column, self.board)
-            yield AddColumn(self.board)
+            self._add_column = AddColumn(self.board)
+            yield self._add_column
 
         yield Footer()
 
     def on_mount(self) -> None:
         self.node_watch(self.board, "sections", self._on_board_sections_changed)
         self.node_watch(self.board.git, "config", self._on_config_changed)
+        for key in ("sections", "meta", "cards", "columns"):
+            self.node_watch(self.board, key, self._on_board_edited)
         self.call_after_refresh(self._focus_first_card)
         self.set_interval(1.0, self._sync_tick)
 
     def _focus_first_card(self) -> None:
-        columns = list(self.query(ColumnWidget))
-        for col in columns:
+        for col in self._columns.query_children(ColumnWidget):
             focusable = [c for c in col.children if c.can_focus]
             if focusable:
                 focusable[0].focus()
@@ -88,20 +114,59 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         if section and key != "*":
             write_git_config_key(self.board.repo_path, section, key, new)
 
+    def _on_board_edited(self, node, key, old, new) -> None:
+        """Note the edit so the next sync follows once edits stop."""
+        self._last_edit = time.monotonic()
+
+    def _sync_intervals(self) -> tuple[float, float]:
+        """Return the (floor, configured) gaps between sync cycles."""
+        configured = self.board.git.config.ganban.sync_interval or 30
+        return min(MIN_SYNC_INTERVAL, configured), configured
+
+    def _sync_due(self, now: float) -> bool:
+        """Whether a sync cycle should start at monotonic time *now*.
+
+        An edit is synced EDIT_QUIET_PERIOD after the last one, or after the
+        configured interval if edits keep coming. Otherwise the delay set by
+        the previous cycle applies, and an untouched board never syncs more
+        often than the configured interval.
+        """
+        floor, configured = self._sync_intervals()
+        since_sync = now - self._last_sync
+        if since_sync < floor:
+            return False
+        if self._last_edit is not None:
+            return now - self._last_edit >= EDIT_QUIET_PERIOD or since_sync >= configured
+        return since_sync >= (configured if self._sync_delay is None else self._sync_delay)
+
     def _sync_tick(self) -> None:
-        """Called every 1s. Starts a sync cycle if interval has elapsed."""
+        """Called every 1s. Starts a sync cycle once one is due."""
         sync = self.board.git.sync
         config = self.board.git.config.ganban
-        if sync.status != "idle":
+        if sync.status != "idle" or self._save_lock.locked():
             return
         if not config.sync_local and not config.sync_remote:
             return
         now = time.monotonic()
-        interval = config.sync_interval or 30
-        if now - self._last_sync < interval:
+        if not self._sync_due(now):
             return
         self._last_sync = now
-        self._sync_task = asyncio.create_task(run_sync_cycle(self.board))
+        self._last_edit = None
+        self._sync_task = asyncio.create_task(self._run_sync())
+
+    async def _run_sync(self) -> None:
+        """Run one sync cycle and pick the delay before the next.
+
+        A cycle that moved the board drops the delay to the floor, and
+        quiet cycles double it back up to the configured interval.
+        """
+        before = self.board.commit
+        await run_sync_cycle(self.board)
+        floor, configured = self._sync_intervals()
+        if self.board.commit != before:
+            self._sync_delay = floor
+        elif self._sync_delay is not None:
+            self._sync_delay = min(self._sync_delay * 2, configured)
 
     def _on_board_sections_changed(self, node, key, old, new) -> None:
         """Update board header when title changes."""
@@ -109,15 +174,20 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         if not keys:
             return  # transient empty state during rename_first_key rebuild
         new_title = keys[0]
-        header = self.query_one("#board-title", EditableText)
-        if header.value != new_title:
-            header.value = new_title
+        if self._header.value != new_title:
+            self._header.value = new_title
 
     # -- Thin delegation: screen routes mouse events to active draggable --
 
     def on_mouse_move(self, event) -> None:
         if self._active_draggable is not None:
-            self._active_draggable._drag_move(event.screen_x, event.screen_y)
+            # Coalesce a burst of moves into one update at the latest position
+            self._drag_pos = (event.screen_x, event.screen_y)
+            self.call_later_once(self._flush_drag_move)
+
+    def _flush_drag_move(self) -> None:
+        if self._active_draggable is not None:
+            self._active_draggable._drag_move(*self._drag_pos)
 
     def on_mouse_up(self, event) -> None:
         if self._active_draggable is not None:
@@ -145,8 +215,7 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         if not isinstance(draggable, ColumnWidget):
             return False
 
-        insert_before = self._calculate_column_insert_position(draggable, x)
-        new_index = self._calculate_column_model_position(draggable, insert_before)
+        new_index, _ = self._column_insert_slot(draggable, x)
 
         draggable.remove_class("dragging")
         draggable.styles.offset = (0, 0)
@@ -159,66 +228,55 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         return True
 
     def _calculate_column_insert_position(self, draggable, screen_x: int) -> Static:
-        columns_container = self.query_one("#columns", Horizontal)
-        visible_columns = [c for c in columns_container.children if isinstance(c, ColumnWidget) and c is not draggable]
-        add_column = columns_container.query_one(AddColumn)
+        return self._column_insert_slot(draggable, screen_x)[1]
 
-        for col in visible_columns:
-            col_mid_x = col.region.x + col.region.width // 2
-            if screen_x < col_mid_x:
-                return col
-        return add_column
+    def _column_insert_slot(self, draggable, screen_x: int) -> tuple[int, Static]:
+        """Return the model index for a drop at screen_x and the widget it lands before."""
+        columns_container = self._columns
+        visible_columns = [c for c in columns_container.children if isinstance(c, ColumnWidget) and c is not draggable]
+        # Columns sit left to right, so binary search reads O(log n) live regions
+        idx = bisect_right(visible_columns, screen_x, key=_mid_x)
+        if idx < len(visible_columns):
+            return idx, visible_columns[idx]
+        return idx, self._add_column
 
     def _ensure_column_placeholder(self, insert_before: Static) -> None:
-        columns_container = self.query_one("#columns", Horizontal)
+        columns_container = self._columns
+        if insert_before is self._placeholder_before and self._column_placeholder is not None:
+            return
+        self._placeholder_before = insert_before
 
         if self._column_placeholder is None:
             self._column_placeholder = ColumnPlaceholder()
             columns_container.mount(self._column_placeholder, before=insert_before)
             return
 
-        children = list(columns_container.children)
-        placeholder_idx = children.index(self._column_placeholder)
-        insert_idx = children.index(insert_before)
-        if placeholder_idx + 1 != insert_idx:
+        if not is_just_before(columns_container.children, self._column_placeholder, insert_before):
             columns_container.move_child(self._column_placeholder, before=insert_before)
 
-    def _calculate_column_model_position(self, draggable, insert_before: Static) -> int:
-        columns_container = self.query_one("#columns", Horizontal)
-        pos = 0
-        for child in columns_container.children:
-            if child is insert_before:
-                break
-            if isinstance(child, ColumnWidget) and child is not draggable:
-                pos += 1
-        return pos
-
     # -- Existing board behavior --
 
     def on_editable_text_changed(self, event: EditableText.Changed) -> None:
         """Update board title when header is edited."""
-        header = self.query_one("#board-title", EditableText)
-        if event.control is header:
+        if event.control is self._header:
             event.stop()
             self.board.sections.rename_first_key(event.new_value)
 
     def on_click(self, event) -> None:
         """Handle clicks on board header area."""
-        settings = self.query_one("#board-settings", Static)
-        if settings.region.contains(event.screen_x, event.screen_y):
+        if self._settings.region.contains(event.screen_x, event.screen_y):
             event.stop()
             self.app.push_screen(BoardDetailModal(self.board))
             return
         if event.button != 3:
             return
-        header = self.query_one("#board-title", EditableText)
-        if header.region.contains(event.screen_x, event.screen_y):
+        if self._header.region.contains(event.screen_x, event.screen_y):
             event.stop()
             self.show_context_menu(event.screen_x, event.screen_y)
 
     def show_context_menu(self, x: int | None = None, y: int | None = None) -> None:
         if x is None or y is None:
-            region = self.query_one("#board-title", EditableText).region
+            region = self._header.region
             x = region.x + region.width // 2
             y = region.y + region.height // 2
         title = first_title(self.board.sections)
@@ -253,10 +311,27 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         """Close the board (quit the app)."""
         await self.app.run_action("quit")
 
-    def action_save(self) -> None:
-        """Save the board to git."""
-        new_commit = save_board(self.board)
-        self.board.commit = new_commit
+    async def wait_for_sync(self) -> None:
+        """Wait for a running sync cycle to finish, without cancelling it."""
+        if self._sync_task is not None and not self._sync_task.done():
+            await asyncio.wait({self._sync_task})
+
+    async def wait_for_git(self) -> None:
+        """Wait for a running sync cycle and any ctrl+s save to finish."""
+        await self.wait_for_sync()
+        async with self._save_lock:
+            pass
+
+    async def action_save(self) -> None:
+        """Save the board to git, off the UI thread like the sync cycle does."""
+        # A second ctrl+s while one is in flight would commit on the same parent
+        if self._save_lock.locked():
+            return
+        async with self._save_lock:
+            # Saving under a sync cycle could move the ref past its merge commit
+            await self.wait_for_sync()
+            if has_unsaved_changes(self.board):
+                self.board.commit = await asyncio.to_thread(save_board, self.board)
         self.notify("Saved")
 
     def on_card_widget_move_requested(self, event: CardWidget.MoveRequested) -> None:
@@ -286,8 +361,8 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
     def on_add_column_column_created(self, event: AddColumn.ColumnCreated) -> None:
         """Handle new column creation."""
         event.stop()
-        columns_container = self.query_one("#columns", Horizontal)
-        add_widget = columns_container.query_one(AddColumn)
+        columns_container = self._columns
+        add_widget = self._add_column
         new_widget = ColumnWidget(event.column, self.board)
         columns_container.mount(new_widget, before=add_widget)
 
@@ -298,17 +373,13 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
 
     def _sync_column_order(self) -> None:
         """Reorder column widgets to match model order."""
-        columns_container = self.query_one("#columns", Horizontal)
-        add_column = columns_container.query_one(AddColumn)
-        widgets_by_column = {id(cw.column): cw for cw in self.query(ColumnWidget)}
-
-        insert_before = add_column
-        for column in reversed(list(self.board.columns)):
-            if id(column) not in widgets_by_column:
-                continue  # skip hidden columns
-            widget = widgets_by_column[id(column)]
-            columns_container.move_child(widget, before=insert_before)
-            insert_before = widget
+        self._placeholder_before = None
+        columns_container = self._columns
+        add_column = self._add_column
+        widgets_by_column = {id(cw.column): cw for cw in columns_container.query_children(ColumnWidget)}
+        # hidden columns have no widget
+        widgets = [widgets_by_column[id(c)] for c in self.board.columns if id(c) in widgets_by_column]
+        reorder_children(columns_container, widgets, before=add_column)
 
     def on_column_widget_move_requested(self, event: ColumnWidget.MoveRequested) -> None:
         """Handle column move request."""
@@ -316,11 +387,10 @@ class BoardScreen(NodeWatcherMixin, DropTarget, Screen):
         col_widget = event.column_widget
         direction = event.direction
 
-        all_cols = list(self.board.columns)
-        current_index = next(i for i, c in enumerate(all_cols) if c is col_widget.column)
-        new_index = current_index + direction
+        columns = self.board.columns
+        new_index = columns.index(col_widget.column.order) + direction
 
-        if new_index < 0 or new_index >= len(all_cols):
+        if new_index < 0 or new_index >= len(columns):
             return
 
         self._move_column_to_index(col_widget, new_index)
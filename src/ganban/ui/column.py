@@ -1,7 +1,9 @@
 """Column widgets for ganban UI."""
 
+from bisect import bisect_right
+
 from textual.app import ComposeResult
-from textual.containers import Horizontal, Vertical
+from textual.containers import Vertical
 from textual.message import Message
 from textual.color import Color, ColorParseError
 from textual.widgets import Rule, Static
@@ -23,12 +25,17 @@ from ganban.ui.constants import (
     ICON_PALETTE,
 )
 from ganban.ui.detail import ColumnDetailModal
-from ganban.ui.drag import CardPlaceholder, DraggableMixin, DropTarget
+from ganban.ui.drag import CardPlaceholder, DraggableMixin, DropTarget, is_just_before, reorder_children
 from ganban.ui.menu import ContextMenu, MenuItem, MenuSeparator
 from ganban.ui.edit import EditableText, TextEditor
 from ganban.ui.watcher import NodeWatcherMixin
 
 
+def _mid_y(widget) -> int:
+    region = widget.region
+    return region.y + region.height // 2
+
+
 class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
     """A single column on the board."""
 
@@ -56,6 +63,10 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
         self.column = column
         self.board = board
         self._card_placeholder: CardPlaceholder | None = None
+        # The widget the placeholder was last put in front of
+        self._placeholder_before: Static | None = None
+        # Kept from compose; cards are inserted before it on every drag move
+        self._add_card: AddCard | None = None
 
     def compose(self) -> ComposeResult:
         name = first_title(self.column.sections)
@@ -63,7 +74,8 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
         yield Rule()
         for card_id in self.column.links:
             yield CardWidget(card_id, self.board)
-        yield AddCard(self.column, self.board)
+        self._add_card = AddCard(self.column, self.board)
+        yield self._add_card
 
     # -- DraggableMixin: column being dragged --
 
@@ -73,27 +85,28 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
 
     def _reposition_ghost(self, x: int, y: int) -> None:
         """Position column relative to its scroll container."""
-        columns_container = self.screen.query_one("#columns", Horizontal)
+        columns_container = self.parent  # the board's #columns container
         container_region = columns_container.region
         new_x = (x - self._drag_offset.x) - container_region.x + columns_container.scroll_x
         new_y = (y - self._drag_offset.y) - container_region.y + columns_container.scroll_y
-        self.styles.offset = (new_x, new_y)
+        self._move_ghost_to(new_x, new_y)
 
     def _drag_start(self, mouse_pos):
         """Override to set initial scroll-relative position before base logic."""
         super()._drag_start(mouse_pos)
         # Re-set offset for scroll-relative positioning
-        columns_container = self.screen.query_one("#columns", Horizontal)
+        columns_container = self.parent  # the board's #columns container
         container_region = columns_container.region
         col_region = self.region
         content_x = col_region.x - container_region.x + columns_container.scroll_x
         content_y = col_region.y - container_region.y + columns_container.scroll_y
-        self.styles.offset = (content_x, content_y)
+        self._move_ghost_to(content_x, content_y)
 
     def _drag_cleanup(self) -> None:
         """Reset offset instead of removing ghost (ghost is self)."""
         self.styles.offset = (0, 0)
         self._ghost = None
+        self._ghost_offset = None
         self._dragging = False
         self._drag_offset = type(self._drag_offset)(0, 0)
         self.remove_class("dragging")
@@ -128,8 +141,7 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
     def try_drop(self, draggable, x: int, y: int) -> bool:
         if not isinstance(draggable, CardWidget):
             return False
-        insert_before = self._calculate_card_insert_position(draggable, y)
-        pos = self._calculate_card_model_position(draggable, insert_before)
+        pos, _ = self._card_insert_slot(draggable, y)
         card_id = draggable.card_id
 
         move_card(draggable.board, card_id, self.column, position=pos)
@@ -143,26 +155,29 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
         return True
 
     def _calculate_card_insert_position(self, draggable, screen_y: int) -> Static:
-        add_widget = self.query_one(AddCard)
-        visible_cards = [c for c in self.children if isinstance(c, CardWidget) and c is not draggable]
+        return self._card_insert_slot(draggable, screen_y)[1]
 
-        for card in visible_cards:
-            card_mid_y = card.region.y + card.region.height // 2
-            if screen_y < card_mid_y:
-                return card
-        return add_widget
+    def _card_insert_slot(self, draggable, screen_y: int) -> tuple[int, Static]:
+        """Return the model position for a drop at screen_y and the widget it lands before."""
+        visible_cards = [c for c in self.children if isinstance(c, CardWidget) and c is not draggable]
+        # Cards stack top to bottom, so binary search reads O(log n) live regions
+        idx = bisect_right(visible_cards, screen_y, key=_mid_y)
+        if idx < len(visible_cards):
+            return idx, visible_cards[idx]
+        return idx, self._add_card
 
     def _ensure_card_placeholder(self, insert_before: Static) -> None:
+        placeholder = self._card_placeholder
+        if insert_before is self._placeholder_before and placeholder is not None and placeholder.parent is self:
+            return
+        self._placeholder_before = insert_before
         if self._card_placeholder is None:
             self._card_placeholder = CardPlaceholder()
             self.mount(self._card_placeholder, before=insert_before)
             return
 
         if self._card_placeholder.parent is self:
-            children = list(self.children)
-            placeholder_idx = children.index(self._card_placeholder)
-            insert_idx = children.index(insert_before)
-            if placeholder_idx + 1 == insert_idx:
+            if is_just_before(self.children, self._card_placeholder, insert_before):
                 return
             self.move_child(self._card_placeholder, before=insert_before)
         else:
@@ -171,15 +186,6 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
             self._card_placeholder = CardPlaceholder()
             self.mount(self._card_placeholder, before=insert_before)
 
-    def _calculate_card_model_position(self, draggable, insert_before: Static) -> int:
-        pos = 0
-        for c in self.children:
-            if c is insert_before:
-                break
-            if isinstance(c, CardWidget) and c is not draggable:
-                pos += 1
-        return pos
-
     # -- Other column behavior --
 
     def on_editable_text_changed(self, event: EditableText.Changed) -> None:
@@ -286,7 +292,7 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
     @staticmethod
     def _refocus_card(column: "ColumnWidget", card_id: str) -> None:
         """Focus a card by id within a specific column."""
-        for card in column.query(CardWidget):
+        for card in column.query_children(CardWidget):
             if card.card_id == card_id:
                 card.focus()
                 return
@@ -322,8 +328,9 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
 
     def _on_links_changed(self, node, key, old, new) -> None:
         """Sync card children to match column.links."""
+        self._placeholder_before = None
         new_links = list(self.column.links) if self.column.links else []
-        existing = {c.card_id: c for c in self.query(CardWidget)}
+        existing = {c.card_id: c for c in self.query_children(CardWidget)}
         new_ids = set(new_links)
 
         # Focus next focusable child when a focused card is removed
@@ -340,23 +347,23 @@ class ColumnWidget(NodeWatcherMixin, DraggableMixin, DropTarget, Vertical):
         if focused_removal:
             self._focus_neighbour(focused_removal)
 
-        # Remove cards no longer in links
-        for card_id, widget in existing.items():
-            if card_id not in new_ids:
-                widget.remove()
-
-        # Add missing cards and reorder
-        add_card = self.query_one(AddCard)
-        for card_id in new_links:
-            if card_id not in existing:
-                widget = CardWidget(card_id, self.board)
-                self.mount(widget, before=add_card)
-                existing[card_id] = widget
-
-        # Reorder to match links
-        for card_id in reversed(new_links):
-            self.move_child(existing[card_id], before=add_card)
-            add_card = existing[card_id]
+        # Removals, mounts and moves repaint once, at the end
+        with self.app.batch_update():
+            # Remove cards no longer in links
+            for card_id, widget in existing.items():
+                if card_id not in new_ids:
+                    widget.remove()
+
+            # Add missing cards and reorder
+            add_card = self._add_card
+            for card_id in new_links:
+                if card_id not in existing:
+                    widget = CardWidget(card_id, self.board)
+                    self.mount(widget, before=add_card)
+                    existing[card_id] = widget
+
+            # Reorder to match links
+            reorder_children(self, [existing[card_id] for card_id in new_links], before=add_card)
 
     def _on_meta_changed(self, node, key, old, new) -> None:
         """Re-apply color and compact state when meta changes."""
@@ -72,7 +72,7 @@ class DepsWidget(NodeWatcherMixin, Container):
         self._rebuild_tags()
 
     def _on_deps_changed(self, source_node: Any, key: str, old: Any, new: Any) -> None:
-        self.call_later(self._rebuild_tags)
+        self.call_later_once(self._rebuild_tags)
 
     def _rebuild_tags(self) -> None:
         """Clear and rebuild the dep tag widgets."""
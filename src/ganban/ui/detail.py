@@ -1,6 +1,7 @@
 """Detail modals for viewing and editing markdown content."""
 
 import re
+from typing import ClassVar
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -51,6 +52,29 @@ class TabButton(Static):
 class DetailModal(ModalScreen[None]):
     """Base modal screen for detail editing."""
 
+    CSS_PATH: ClassVar[list[str]] = [
+        "detail.tcss",
+        "users.tcss",
+        "done.tcss",
+        "due.tcss",
+        "confirm.tcss",
+        "assignee.tcss",
+        "deps.tcss",
+        "labels.tcss",
+        "labels_editor.tcss",
+        "cal.tcss",
+        "emoji.tcss",
+        "tag.tcss",
+        "search.tcss",
+        "edit/section.tcss",
+        "edit/viewers.tcss",
+        "edit/meta.tcss",
+        "edit/document.tcss",
+        "edit/comments.tcss",
+        "edit/tasks.tcss",
+        "edit/completion.tcss",
+    ]
+
     BINDINGS = [
         ("escape", "close", "Close"),
         ("ctrl+q", "quit", "Quit"),
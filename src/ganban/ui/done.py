@@ -35,14 +35,13 @@ class DoneWidget(NodeWatcherMixin, Container):
         self._update_display()
 
     def _on_done_changed(self, node, key, old, new) -> None:
-        self.call_later(self._update_display)
+        self.call_later_once(self._update_display)
 
     def _update_display(self) -> None:
         toggle = self.query_one(".done-toggle", Static)
-        if self.meta.done:
-            toggle.update(ICON_CHECKED)
-        else:
-            toggle.update(ICON_UNCHECKED)
+        icon = ICON_CHECKED if self.meta.done else ICON_UNCHECKED
+        if toggle.content != icon:
+            toggle.update(icon)
 
     def on_click(self, event) -> None:
         event.stop()
@@ -3,16 +3,20 @@
 Two mixins:
 - DraggableMixin: on dragged widgets, owns the "flying" phase
 - DropTarget: on containers, owns the "landing" phase
+
+Plus reorder_children, which lands a new order with as few moves as possible.
 """
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import TYPE_CHECKING
 
 from textual.geometry import Offset, Region
 from textual.widgets import Static
 
 if TYPE_CHECKING:
+    from textual._node_list import NodeList
     from textual.widget import Widget
 
 
@@ -57,6 +61,7 @@ class DraggableMixin:
         self._ghost: Widget | None = None
         self._drag_offset: Offset = Offset(0, 0)
         self._current_target: DropTarget | None = None
+        self._ghost_offset: tuple[int, int] | None = None
 
     @property
     def is_dragging(self) -> bool:
@@ -110,7 +115,7 @@ class DraggableMixin:
 
         if self._ghost is not self:
             self._ghost.styles.width = region.width
-            self._ghost.styles.offset = (region.x, region.y)
+            self._move_ghost_to(region.x, region.y)
             self.screen.mount(self._ghost)
 
         self.screen._active_draggable = self
@@ -127,7 +132,14 @@ class DraggableMixin:
             return
         new_x = x - self._drag_offset.x
         new_y = y - self._drag_offset.y
-        self._ghost.styles.offset = (new_x, new_y)
+        self._move_ghost_to(new_x, new_y)
+
+    def _move_ghost_to(self, x: int, y: int) -> None:
+        """Set the ghost's offset, skipping the style write if it hasn't moved."""
+        if (x, y) == self._ghost_offset:
+            return
+        self._ghost_offset = (x, y)
+        self._ghost.styles.offset = (x, y)
 
     def _update_drop_target(self, x: int, y: int) -> None:
         """Hit-test for DropTargets and call drag_over/drag_away."""
@@ -183,6 +195,7 @@ class DraggableMixin:
         if self._ghost is not None and self._ghost is not self:
             self._ghost.remove()
         self._ghost = None
+        self._ghost_offset = None
         self._dragging = False
         self._drag_offset = Offset(0, 0)
         self.remove_class("dragging")
@@ -197,16 +210,9 @@ class DraggableMixin:
             return None
 
         for widget, _region in widgets:
-            # Skip ghost and its children
-            if self._ghost is not None and self._ghost is not self:
-                if widget is self._ghost or self._ghost in widget.ancestors:
-                    continue
-            # Walk ancestors for DropTarget
-            candidate = widget
-            while candidate is not None:
-                if isinstance(candidate, DropTarget) and candidate is not self:
-                    return candidate
-                candidate = candidate.parent
+            targets = self._targets_above(widget)
+            if targets:
+                return targets[0]
         return None
 
     def _iter_drop_targets(self, x: int, y: int) -> list[DropTarget]:
@@ -219,17 +225,29 @@ class DraggableMixin:
 
         seen = set()
         for widget, _region in widgets:
-            if self._ghost is not None and self._ghost is not self:
-                if widget is self._ghost or self._ghost in widget.ancestors:
-                    continue
-            candidate = widget
-            while candidate is not None:
-                if isinstance(candidate, DropTarget) and candidate is not self:
-                    cid = id(candidate)
-                    if cid not in seen:
-                        seen.add(cid)
-                        targets.append(candidate)
-                candidate = candidate.parent
+            for candidate in self._targets_above(widget):
+                cid = id(candidate)
+                if cid not in seen:
+                    seen.add(cid)
+                    targets.append(candidate)
+        return targets
+
+    def _targets_above(self, widget: Widget) -> list[DropTarget]:
+        """DropTargets from widget up to the screen, innermost first.
+
+        Empty if the widget is part of the ghost. One walk up the parents
+        does both checks, since this runs for every widget under the
+        pointer on every mouse move.
+        """
+        ghost = self._ghost if self._ghost is not self else None
+        targets: list[DropTarget] = []
+        candidate = widget
+        while candidate is not None:
+            if candidate is ghost:
+                return []
+            if isinstance(candidate, DropTarget) and candidate is not self:
+                targets.append(candidate)
+            candidate = candidate.parent
         return targets
 
     def draggable_make_ghost(self) -> Widget:
@@ -241,6 +259,55 @@ class DraggableMixin:
         raise NotImplementedError
 
 
+def is_just_before(children: NodeList, widget: Widget, other: Widget) -> bool:
+    """Check whether widget is the sibling immediately before other.
+
+    Looks up one index in the live child list rather than copying it.
+    """
+    idx = children.index(widget)
+    return idx + 1 < len(children) and children[idx + 1] is other
+
+
+def _stable_positions(order: list[int]) -> set[int]:
+    """Return the positions of a longest increasing subsequence of order."""
+    tails: list[int] = []  # smallest tail value of a run of each length
+    tail_at: list[int] = []  # index into order of that tail
+    prev: list[int] = [-1] * len(order)
+    for i, value in enumerate(order):
+        k = bisect_left(tails, value)
+        if k:
+            prev[i] = tail_at[k - 1]
+        if k == len(tails):
+            tails.append(value)
+            tail_at.append(i)
+        else:
+            tails[k] = value
+            tail_at[k] = i
+    stable: set[int] = set()
+    i = tail_at[-1] if tail_at else -1
+    while i != -1:
+        stable.add(i)
+        i = prev[i]
+    return stable
+
+
+def reorder_children(container: Widget, widgets: list[Widget], before: Widget) -> None:
+    """Move container's widgets into the given order, ending just before ``before``.
+
+    Widgets already in relative order (a longest increasing run of their
+    current positions) stay put; only the others are moved, so a single
+    drag costs one move_child rather than one per widget.
+    """
+    positions = {id(child): i for i, child in enumerate(container.children)}
+    stable = _stable_positions([positions[id(w)] for w in widgets])
+    if len(stable) == len(widgets):
+        return
+    for i in range(len(widgets) - 1, -1, -1):
+        if i not in stable:
+            container.move_child(widgets[i], before=before)
+        before = widgets[i]
+
+
 class DragGhost(Static):
     """Floating overlay showing the card being dragged."""
 
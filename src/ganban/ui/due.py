@@ -47,7 +47,7 @@ class DueDateWidget(NodeWatcherMixin, Container):
         self._update_label()
 
     def _on_due_changed(self, node, key, old, new) -> None:
-        self.call_later(self._update_label)
+        self.call_later_once(self._update_label)
 
     def _update_label(self) -> None:
         label = self.query_one(".due-text", Static)
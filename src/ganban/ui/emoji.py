@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import re
+from functools import lru_cache
 from typing import Any
 
 from textual.message import Message
@@ -28,6 +29,7 @@ DEFAULT_EMOJIS = "🥳😄😙😬😆🤓😱😂🙃😊😁😛😏"
 _COMMITTER_RE = re.compile(r"^(.+?)\s*<([^>]+)>$")
 
 
+@lru_cache(maxsize=4096)
 def emoji_for_email(email: str) -> str:
     """Pick a deterministic default emoji for an email address.
 
@@ -37,6 +39,7 @@ def emoji_for_email(email: str) -> str:
     return DEFAULT_EMOJIS[last_nibble % len(DEFAULT_EMOJIS)]
 
 
+@lru_cache(maxsize=4096)
 def parse_committer(committer: str) -> tuple[str, str, str]:
     """Parse a committer string into (emoji, name, email).
 
@@ -116,11 +119,25 @@ def find_user_by_email(email: str, meta: Node | None) -> tuple[str, Node] | None
     users = meta.users if meta else None
     if users is None:
         return None
+    return _email_index(users).get(email)
+
+
+def _email_index(users: Node) -> dict[str, tuple[str, Node]]:
+    """Map each email in meta.users to its (user_name, user_node).
+
+    Cached on the users node until anything beneath it changes.
+    """
+    cached = getattr(users, "_email_index", None)
+    if cached is not None and cached[0] == users._version:
+        return cached[1]
+    index: dict[str, tuple[str, Node]] = {}
     for user_name, user_node in users.items():
         emails = user_node.emails
-        if isinstance(emails, list) and email in emails:
-            return user_name, user_node
-    return None
+        if isinstance(emails, list):
+            for email in emails:
+                index.setdefault(email, (user_name, user_node))
+    users._email_index = (users._version, index)
+    return index
 
 
 def resolve_email_display(
@@ -140,13 +157,30 @@ def resolve_email_display(
         emoji = user_node.emoji or emoji_for_email(email)
         return emoji, name
     if committers:
-        for committer_str in committers:
-            _, cname, cemail = parse_committer(committer_str)
-            if cemail == email:
-                return emoji_for_email(email), cname
+        cname = _committer_names(committers).get(email)
+        if cname is not None:
+            return emoji_for_email(email), cname
     return None
 
 
+# The last committers list seen and its email -> name map. The list is
+# replaced, not mutated, when the board reloads.
+_committer_index: tuple[list[str], dict[str, str]] | None = None
+
+
+def _committer_names(committers: list[str]) -> dict[str, str]:
+    """Map each committer email to the name of its first committer string."""
+    global _committer_index
+    if _committer_index is not None and _committer_index[0] is committers:
+        return _committer_index[1]
+    names: dict[str, str] = {}
+    for committer_str in committers:
+        _, cname, cemail = parse_committer(committer_str)
+        names.setdefault(cemail, cname)
+    _committer_index = (committers, names)
+    return names
+
+
 def resolve_email_emoji(email: str, meta: Node) -> str:
     """Look up the emoji for an email from meta.users, falling back to hash."""
     result = resolve_email_display(email, meta)
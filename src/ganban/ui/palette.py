@@ -1,6 +1,7 @@
 """Color palette and label color hashing."""
 
 import hashlib
+from functools import lru_cache
 
 from ganban.model.node import Node
 
@@ -55,16 +56,19 @@ LABEL_COLORS: list[str] = [
     "#cc8800",  # amber
 ]
 
+_LABEL_COLOR_COUNT = len(LABEL_COLORS)
 
+
+@lru_cache(maxsize=512)
 def color_for_label(label: str) -> str:
     """Deterministic hex color from label name.
 
     Uses the sum of all md5 bytes mod palette size, which spreads
     common label names across the palette with minimal collisions.
+    MD5 is only a stable spreader here, not a security measure.
     """
-    h = hashlib.md5(label.encode()).hexdigest()
-    index = sum(int(h[i : i + 2], 16) for i in range(0, 32, 2))
-    return LABEL_COLORS[index % len(LABEL_COLORS)]
+    index = sum(hashlib.md5(label.encode(), usedforsecurity=False).digest())
+    return LABEL_COLORS[index % _LABEL_COLOR_COUNT]
 
 
 def get_label_color(name: str, board: Node) -> str:
@@ -1,16 +1,26 @@
 """Static widget variants."""
 
 from textual.events import Click
+from textual.visual import VisualType
 from textual.widgets import Static
 
 from ganban.ui.constants import ICON_CLOSE
 
 
 class PlainStatic(Static):
-    """Static that doesn't allow text selection."""
+    """Static that doesn't allow text selection.
+
+    Updating it with the content it already shows is a no-op, so callers
+    can refresh from the model without forcing a re-render and layout.
+    """
 
     ALLOW_SELECT = False
 
+    def update(self, content: VisualType = "", *, layout: bool = True) -> None:
+        if content == self.content:
+            return
+        super().update(content, layout=layout)
+
 
 class CloseButton(Static):
     """Close button that triggers the screen's close action."""
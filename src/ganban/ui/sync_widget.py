@@ -60,7 +60,7 @@ class SyncWidget(NodeWatcherMixin, Container):
         self._update_display()
 
     def _on_sync_changed(self, node, key, old, new) -> None:
-        self.call_later(self._update_display)
+        self.call_later_once(self._update_display)
 
     def _update_display(self) -> None:
         icon_widget = self.query_one(".sync-icon", Static)
@@ -51,11 +51,14 @@ class Tag(Static):
         self.value = value
         self._display: str | Text = display if display is not None else value
         self._pending_edit_options: list[tuple[str, str]] | None = None
+        # Mounted on first edit; most tags are never edited
+        self._search: SearchInput | None = None
+        # Latest options asked for while the search input is still mounting
+        self._search_options: list[tuple[str, str]] = []
 
     def compose(self) -> ComposeResult:
         with Horizontal(classes="tag-row"):
             yield Static(self._display, classes="tag-label")
-            yield SearchInput([], classes="tag-search")
             yield Static(ICON_DELETE, classes="tag-delete")
 
     def on_mount(self) -> None:
@@ -73,21 +76,39 @@ class Tag(Static):
         """Enter edit mode with the given search options.
 
         If called before the widget is composed, defers until on_mount.
+        The search input is mounted the first time, then kept for reuse.
         """
         try:
-            search = self.query_one(".tag-search", SearchInput)
+            row = self.query_one(".tag-row", Horizontal)
         except NoMatches:
             self._pending_edit_options = options
             return
         self.add_class("-editing")
-        search.set_options(options)
-        inp = search.query_one(Input)
+        if self._search is None:
+            self._search = SearchInput([], classes="tag-search")
+            self._search_options = options
+            self.call_later(self._mount_search, row)
+            return
+        if not self._search.is_mounted:
+            # still mounting; it opens with these once it's ready
+            self._search_options = options
+            return
+        self._open_search(options)
+
+    async def _mount_search(self, row: Horizontal) -> None:
+        await row.mount(self._search, before=row.query_one(".tag-delete"))
+        if self.has_class("-editing"):
+            self._open_search(self._search_options)
+
+    def _open_search(self, options: list[tuple[str, str]]) -> None:
+        self._search.set_options(options)
+        inp = self._search.query_one(Input)
         inp.value = ""
         inp.focus()
 
     def _exit_edit_mode(self) -> None:
-        search = self.query_one(".tag-search", SearchInput)
-        search._close_dropdown()
+        if self._search is not None and self._search.is_mounted:
+            self._search._close_dropdown()
         self.remove_class("-editing")
         if not self.value:
             self.post_message(self.Deleted(self))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from contextlib import contextmanager
 from typing import Any
 
@@ -15,12 +16,14 @@ class NodeWatcherMixin:
     - Call ``_init_watcher()`` in ``__init__``
     - Use ``self.node_watch(node, key, callback)`` instead of ``node.watch(...)``
     - Use ``with self.suppressing():`` around model writes
+    - Use ``self.call_later_once(...)`` to refresh from a watch callback
     - Skip writing ``on_unmount`` -- the mixin handles cleanup
     """
 
     def _init_watcher(self) -> None:
         self._watches: list[tuple[Node | ListNode, str, Callback]] = []
         self._suppressing = False
+        self._pending_calls: set[Callable[[], Any]] = set()
 
     def node_watch(self, node: Node | ListNode, key: str, callback: Callback) -> None:
         """Register a watch that is auto-guarded by suppression and auto-cleaned on unmount."""
@@ -32,6 +35,22 @@ class NodeWatcherMixin:
         unwatch = node.watch(key, guarded)
         self._watches.append(unwatch)
 
+    def call_later_once(self, callback: Callable[[], Any]) -> None:
+        """Schedule callback with ``call_later`` unless it's already pending.
+
+        A burst of changes, such as a reload touching many keys, then
+        refreshes the widget once instead of once per change.
+        """
+        if callback in self._pending_calls:
+            return
+        self._pending_calls.add(callback)
+
+        def run() -> None:
+            self._pending_calls.discard(callback)
+            callback()
+
+        self.call_later(run)
+
     @contextmanager
     def suppressing(self):
         """Context manager that suppresses watch callbacks for model writes."""
@@ -142,3 +142,43 @@ def test_build_column_path_normal():
 
 def test_build_column_path_hidden():
     assert build_column_path("1", "Archive", hidden=True) == ".1.archive"
+
+
+def test_move_column_leaves_earlier_columns_alone(tmp_path):
+    board = _make_board(
+        tmp_path,
+        columns=[
+            _make_column("1", "Backlog"),
+            _make_column("2", "Doing"),
+            _make_column("3", "Review"),
+            _make_column("4", "Done"),
+        ],
+    )
+    changed = []
+    board.columns.watch("1", lambda *args: changed.append("1"))
+    board.columns.watch("2", lambda *args: changed.append("2"))
+    move_column(board, board.columns["4"], 2)
+    names = [first_title(c.sections) for c in board.columns]
+    assert names == ["Backlog", "Doing", "Done", "Review"]
+    assert board.columns.keys() == ["1", "2", "3", "4"]
+    assert board.columns["3"].dir_path == "3.done"
+    assert changed == []
+
+
+def test_move_column_keeps_later_paths(tmp_path):
+    board = _make_board(
+        tmp_path,
+        columns=[
+            _make_column("1", "Backlog"),
+            _make_column("2", "Doing"),
+            _make_column("3", "Done"),
+        ],
+    )
+    done = board.columns["3"]
+    paths = []
+    done.watch("dir_path", lambda *args: paths.append(args))
+    move_column(board, board.columns["2"], 0)
+    assert [first_title(c.sections) for c in board.columns] == ["Doing", "Backlog", "Done"]
+    assert board.columns["3"] is done
+    assert done.dir_path == "3.done"
+    assert paths == []
@@ -130,6 +130,15 @@ def test_load_board_card_meta(sample_board):
     assert card.meta.tags == ["urgent"]
 
 
+def test_load_board_meta_not_shared_between_loads(sample_board):
+    """Reused parses still give each load its own meta."""
+    first = load_board(str(sample_board))
+    second = load_board(str(sample_board))
+    first.cards["3"].meta.tags.append("later")
+    assert second.cards["3"].meta.tags == ["urgent"]
+    assert first.cards["3"].sections is not second.cards["3"].sections
+
+
 def test_load_board_column_meta(sample_board):
     board = load_board(str(sample_board))
     col = board.columns["2"]
@@ -199,6 +208,19 @@ def test_get_committers_multiple_authors(tmp_path):
     assert result == ["Alice <alice@example.com>", "Bob <bob@example.com>"]
 
 
+def test_get_committers_recent_only(tmp_path):
+    """Only the most recent max_count commits are considered; no commits gives none."""
+    repo = Repo.init(tmp_path)
+    assert _get_committers(repo) == []
+    (tmp_path / "a.txt").write_text("a")
+    repo.index.add(["a.txt"])
+    repo.index.commit("first", author=Actor("Bob", "bob@example.com"))
+    (tmp_path / "b.txt").write_text("b")
+    repo.index.add(["b.txt"])
+    repo.index.commit("second", author=Actor("Zoë", "zoe@example.com"))
+    assert _get_committers(repo, max_count=1) == ["Zoë <zoe@example.com>"]
+
+
 def test_load_board_adopts_regular_file_as_card(tmp_path):
     """A regular .md file in a column directory is adopted as a new card."""
     repo = Repo.init(tmp_path)
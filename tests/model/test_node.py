@@ -1,5 +1,7 @@
 """Tests for the reactive Node and ListNode tree."""
 
+import pytest
+
 from ganban.model.node import ListNode, Node
 
 
@@ -188,6 +190,24 @@ def test_deep_bubble():
     assert events[0] == ("color", "#ff0000")
 
 
+def test_version_bumps_up_the_parent_chain():
+    root = Node()
+    root.columns = ListNode()
+    root.columns["1"] = {"meta": {"color": "#800000"}}
+    col = root.columns["1"]
+    before = (root._version, root.columns._version, col._version, col.meta._version)
+    col.meta.color = "#ff0000"
+    after = (root._version, root.columns._version, col._version, col.meta._version)
+    assert all(a == b + 1 for a, b in zip(after, before, strict=True))
+
+
+def test_version_unchanged_without_event():
+    node = Node(tags=["a"])
+    before = node._version
+    node.tags = ["a"]
+    assert node._version == before
+
+
 # --- ListNode basics ---
 
 
@@ -215,6 +235,15 @@ def test_list_node_iter_order():
     assert names == ["Backlog", "Doing", "Done"]
 
 
+def test_list_node_index():
+    lst = ListNode()
+    lst["1"] = {"name": "Backlog"}
+    lst["2"] = {"name": "Doing"}
+    assert lst.index("2") == 1
+    with pytest.raises(KeyError):
+        lst.index("3")
+
+
 def test_list_node_len():
     lst = ListNode()
     assert len(lst) == 0
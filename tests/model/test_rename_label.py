@@ -42,6 +42,15 @@ def test_rename_label_updates_cards():
     assert board.cards["002"].meta.labels == ["defect"]
 
 
+def test_rename_label_notifies_watchers():
+    """Renaming assigns a new list so watchers (and save caches) see the change."""
+    board = _board_with_labels(card_labels={"001": ["bug", "feature"]})
+    events = []
+    board.cards["001"].meta.watch("labels", lambda n, k, old, new: events.append((old, new)))
+    rename_label(board, "bug", "defect")
+    assert events == [(["bug", "feature"], ["defect", "feature"])]
+
+
 def test_rename_label_updates_board_meta():
     """Board.meta.labels key is renamed."""
     board = _board_with_labels(
@@ -1,20 +1,32 @@
 """Tests for the Node-tree board writer."""
 
+import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 from git import Repo
 
+from ganban.model import writer
 from ganban.model.card import create_card
 from ganban.model.column import create_column
 from ganban.model.loader import load_board
 from ganban.model.node import ListNode, Node
 from ganban.model.writer import (
     MergeRequired,
+    _blob_cache,
+    _card_slug,
+    _get_branch_tip,
+    _get_merge_base,
+    _hash_objects,
+    _node_text,
     meta_to_dict,
     check_for_merge,
     check_remote_for_merge,
+    git_session,
+    has_unsaved_changes,
+    invalidate_ref_cache,
     save_board,
     try_auto_merge,
 )
@@ -267,6 +279,34 @@ def test_save_noop_skips_commit(repo_with_ganban):
     assert len(commits_after) == len(commits_before)
 
 
+def test_has_unsaved_changes(repo_with_ganban):
+    """Content edits make a board dirty until saved; sync state doesn't."""
+    board = load_board(str(repo_with_ganban))
+    assert not has_unsaved_changes(board)
+
+    board.git.sync = Node(status="pull")
+    assert not has_unsaved_changes(board)
+
+    board.cards["1"].sections["First card"] = "Edited."
+    assert has_unsaved_changes(board)
+
+    board.commit = save_board(board)
+    assert not has_unsaved_changes(board)
+
+    board.meta = {"color": "red"}
+    assert has_unsaved_changes(board)
+
+
+def test_save_twice_without_reload_skips_second_commit(repo_with_ganban):
+    """A save straight after a save is a no-op when nothing changed."""
+    board = load_board(str(repo_with_ganban))
+    board.cards["1"].sections["First card"] = "Changed"
+    board.commit = save_board(board)
+
+    assert save_board(board, message="Should not appear") == board.commit
+    assert Repo(repo_with_ganban).commit("ganban").hexsha == board.commit
+
+
 def test_save_with_explicit_parents(repo_with_ganban):
     """Can save with explicit parent commits for merge."""
     board = load_board(str(repo_with_ganban))
@@ -286,6 +326,50 @@ def test_save_with_explicit_parents(repo_with_ganban):
     assert len(commit.parents) == 2
 
 
+def test_hash_objects_batches_and_dedupes(empty_repo):
+    """Blobs are written in one pass and duplicates collapse to one entry."""
+    blobs = _hash_objects(empty_repo, ["one\n", "two\n", "one\n"])
+
+    assert list(blobs) == ["one\n", "two\n"]
+    repo = Repo(empty_repo)
+    assert repo.git.cat_file("-p", blobs["one\n"]) == "one"
+    assert repo.git.cat_file("-p", blobs["two\n"]) == "two"
+    assert _hash_objects(empty_repo, []) == {}
+
+
+def test_hash_objects_reuses_known_blobs(empty_repo):
+    """Contents already written to the repo don't go back through git."""
+    first = _hash_objects(empty_repo, ["one\n"])
+    second = _hash_objects(empty_repo, ["one\n", "two\n"])
+
+    assert second["one\n"] == first["one\n"]
+    assert _blob_cache[(str(empty_repo), "two\n")] == second["two\n"]
+
+
+def test_node_text_is_reused_until_changed():
+    """Serialized text is cached on the node and refreshed after a change."""
+    card = _make_card("Card", "Body", meta={"labels": ["bug"]})
+    text = _node_text(card)
+    assert _node_text(card) is text
+
+    card.meta.labels = ["bug", "ui"]
+    changed = _node_text(card)
+    assert changed is not text
+    assert "- ui" in changed
+
+    card.sections["Card"] = "New body"
+    assert "New body" in _node_text(card)
+
+
+def test_card_slug_follows_title_changes():
+    """The cached slug is reused until the card is retitled."""
+    card = _make_card("Fix Login Bug", "Body")
+    assert _card_slug(card) == "fix-login-bug"
+
+    card.sections.rename_first_key("Fix Logout Bug")
+    assert _card_slug(card) == "fix-logout-bug"
+
+
 # --- Merge detection tests ---
 
 
@@ -393,6 +477,29 @@ def test_auto_merge_clean(repo_with_ganban):
     assert loaded.cards["2"] is not None
 
 
+def test_auto_merge_theirs_unchanged_keeps_our_tree(repo_with_ganban):
+    """When the other side changed no content, the merge keeps our tree as-is."""
+    board = load_board(str(repo_with_ganban))
+    original_commit = board.commit
+
+    # Another process records a commit that doesn't change the tree
+    repo = Repo(repo_with_ganban)
+    tree = repo.commit(original_commit).tree.hexsha
+    theirs = repo.git.commit_tree(tree, "-p", original_commit, "-m", "Empty")
+    repo.git.update_ref("refs/heads/ganban", theirs)
+
+    board.cards["1"].sections["First card"] = "Ours"
+    merge_info = check_for_merge(board)
+    assert merge_info is not None
+
+    new_commit = try_auto_merge(board, merge_info)
+
+    merged = repo.commit(new_commit)
+    assert [p.hexsha for p in merged.parents] == [original_commit, theirs]
+    loaded = load_board(str(repo_with_ganban))
+    assert loaded.cards["1"].sections["First card"] == "Ours"
+
+
 def test_auto_merge_conflict_theirs_wins(repo_with_ganban):
     """Conflict resolved by most-recent-commit-wins (theirs is newer)."""
     board = load_board(str(repo_with_ganban))
@@ -770,3 +877,199 @@ def testmeta_to_dict_empty():
     assert meta_to_dict(Node()) == {}
     assert meta_to_dict({}) == {}
     assert meta_to_dict(None) == {}
+
+
+def testmeta_to_dict_deeply_nested():
+    """Deep nesting doesn't hit the recursion limit."""
+
+    meta = Node()
+    node = meta
+    for _ in range(2000):
+        node.child = {}
+        node = node.child
+    node.leaf = 1
+
+    result = meta_to_dict(meta)
+    for _ in range(2000):
+        result = result["child"]
+    assert result == {"leaf": 1}
+
+
+# --- Ref cache tests ---
+
+
+def test_save_invalidates_cached_tip(repo_with_ganban):
+    """A save moves the branch and the next merge check sees the new tip."""
+    board = load_board(str(repo_with_ganban))
+    assert check_for_merge(board) is None
+
+    board.cards["1"].sections["First card"] = "Changed"
+    board.commit = save_board(board)
+
+    assert _get_branch_tip(repo_with_ganban, "ganban") == board.commit
+    assert check_for_merge(board) is None
+
+
+def test_ref_cache_expires(repo_with_ganban, monkeypatch):
+    """External ref moves are picked up once the TTL has elapsed."""
+    monkeypatch.setattr("ganban.model.writer.REF_CACHE_TTL", 0)
+    board = load_board(str(repo_with_ganban))
+    assert _get_branch_tip(repo_with_ganban, "ganban") == board.commit
+
+    repo = Repo(repo_with_ganban)
+    repo.git.checkout("ganban")
+    (repo_with_ganban / ".all" / "002.md").write_text("# External card\n")
+    repo.git.add("-A")
+    external_commit = repo.index.commit("External change").hexsha
+
+    assert _get_branch_tip(repo_with_ganban, "ganban") == external_commit
+
+
+def test_invalidate_ref_cache(repo_with_ganban):
+    """Invalidating forgets cached refs for the repo."""
+    board = load_board(str(repo_with_ganban))
+    assert _get_branch_tip(repo_with_ganban, "ganban") == board.commit
+
+    repo = Repo(repo_with_ganban)
+    repo.git.checkout("ganban")
+    (repo_with_ganban / ".all" / "002.md").write_text("# External card\n")
+    repo.git.add("-A")
+    external_commit = repo.index.commit("External change").hexsha
+
+    invalidate_ref_cache(repo_with_ganban)
+    assert _get_branch_tip(repo_with_ganban, "ganban") == external_commit
+
+
+# --- GitSession tests ---
+
+
+def test_session_resolves_refs_and_trees(repo_with_ganban):
+    """The session resolves refs and tree revs, returning None when missing."""
+    repo = Repo(repo_with_ganban)
+    session = git_session(repo_with_ganban)
+
+    tip = repo.commit("ganban")
+    assert session.resolve("refs/heads/ganban") == tip.hexsha
+    assert session.resolve(f"{tip.hexsha}^{{tree}}") == tip.tree.hexsha
+    assert session.resolve("refs/heads/missing") is None
+
+
+def test_session_sees_external_ref_updates(repo_with_ganban):
+    """A long-lived session picks up refs moved by other processes."""
+    session = git_session(repo_with_ganban)
+    before = session.resolve("refs/heads/ganban")
+
+    repo = Repo(repo_with_ganban)
+    repo.git.checkout("ganban")
+    (repo_with_ganban / ".all" / "002.md").write_text("# External card\n")
+    repo.git.add("-A")
+    external_commit = repo.index.commit("External change").hexsha
+
+    assert external_commit != before
+    assert session.resolve("refs/heads/ganban") == external_commit
+
+
+def test_session_is_shared_and_restarts_after_close(repo_with_ganban):
+    """The same session is returned per repo and reopens after close."""
+    session = git_session(repo_with_ganban)
+    assert git_session(str(repo_with_ganban)) is session
+
+    tip = session.resolve("refs/heads/ganban")
+    session.close()
+    assert session.resolve("refs/heads/ganban") == tip
+
+
+def test_session_update_ref(repo_with_ganban):
+    """update_ref moves a branch and fails loudly on a bad object."""
+    repo = Repo(repo_with_ganban)
+    session = git_session(repo_with_ganban)
+    tip = repo.commit("ganban").hexsha
+
+    session.update_ref("refs/heads/copy", tip)
+    assert repo.commit("copy").hexsha == tip
+
+    with pytest.raises(subprocess.CalledProcessError):
+        session.update_ref("refs/heads/copy", "0" * 39 + "1")
+    assert session.resolve("refs/heads/copy") == tip
+
+
+def test_merge_base_cached_per_pair(repo_with_ganban):
+    """Merge bases are remembered on the session regardless of argument order."""
+    board = load_board(str(repo_with_ganban))
+    base = board.commit
+
+    repo = Repo(repo_with_ganban)
+    tree = repo.commit(base).tree.hexsha
+    left = repo.git.commit_tree(tree, "-p", base, "-m", "Left")
+    right = repo.git.commit_tree(tree, "-p", base, "-m", "Right")
+
+    assert _get_merge_base(repo_with_ganban, left, right) == base
+    assert git_session(repo_with_ganban).merge_bases[tuple(sorted((left, right)))] == base
+    assert _get_merge_base(repo_with_ganban, right, left) == base
+
+
+def test_merge_trees_runs_git_when_trees_unknown(repo_with_ganban, monkeypatch):
+    """A tree lookup that fails doesn't count as "nothing to merge"."""
+    board = load_board(str(repo_with_ganban))
+    base = board.commit
+    repo = Repo(repo_with_ganban)
+    tree = repo.commit(base).tree.hexsha
+    theirs = repo.git.commit_tree(tree, "-p", base, "-m", "Theirs")
+
+    commands = []
+    run_git = writer.run_git
+
+    def recording_run_git(repo_path, args, **kwargs):
+        commands.append(args[0])
+        return run_git(repo_path, args, **kwargs)
+
+    monkeypatch.setattr(writer, "_commit_tree", lambda repo_path, commit: None)
+    monkeypatch.setattr(writer, "run_git", recording_run_git)
+    writer._merge_trees(repo_with_ganban, base, tree, theirs)
+    assert "merge-tree" in commands
+
+
+def test_merge_base_cache_is_bounded(repo_with_ganban, monkeypatch):
+    """The session keeps at most MAX_MERGE_BASES pairs, dropping the oldest."""
+    monkeypatch.setattr(writer, "MAX_MERGE_BASES", 2)
+    board = load_board(str(repo_with_ganban))
+    base = board.commit
+
+    repo = Repo(repo_with_ganban)
+    tree = repo.commit(base).tree.hexsha
+    tips = [repo.git.commit_tree(tree, "-p", base, "-m", f"Tip {i}") for i in range(3)]
+    pairs = [tuple(sorted((base, tip))) for tip in tips]
+    for tip in tips:
+        assert _get_merge_base(repo_with_ganban, base, tip) == base
+
+    assert list(git_session(repo_with_ganban).merge_bases) == pairs[1:]
+
+
+def test_merge_base_cache_from_threads(repo_with_ganban, monkeypatch):
+    """Parallel lookups keep the cache within bounds and answer correctly."""
+    monkeypatch.setattr(writer, "MAX_MERGE_BASES", 2)
+    board = load_board(str(repo_with_ganban))
+    base = board.commit
+
+    repo = Repo(repo_with_ganban)
+    tree = repo.commit(base).tree.hexsha
+    tips = [repo.git.commit_tree(tree, "-p", base, "-m", f"Tip {i}") for i in range(6)]
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        results = list(pool.map(lambda tip: _get_merge_base(repo_with_ganban, base, tip), tips * 3))
+
+    assert results == [base] * len(results)
+    assert len(git_session(repo_with_ganban).merge_bases) <= 2
+
+
+def test_session_mktree(repo_with_ganban):
+    """mktree writes nested and empty trees through one process."""
+    repo = Repo(repo_with_ganban)
+    session = git_session(repo_with_ganban)
+    blob = repo.commit("ganban").tree[".all"]["001.md"].hexsha
+
+    empty = session.mktree([])
+    assert empty == "4b825dc642cb6eb9a060e54bf8d69288fbee4904"
+    inner = session.mktree([("100644", "blob", blob, "card.md")])
+    outer = session.mktree([("040000", "tree", inner, "dir"), ("040000", "tree", empty, "empty")])
+
+    assert repo.git.ls_tree("-r", "--name-only", outer) == "dir/card.md"
@@ -203,3 +203,55 @@ async def test_sync_picks_up_external_changes(local_repo):
 
     assert board.git.sync.status == "idle"
     assert len(board.cards) == original_card_count + 1
+
+
+# --- multiple remotes ---
+
+
+@pytest.mark.asyncio
+async def test_sync_two_remotes_same_change(tmp_path, synced_repos):
+    """Two remotes carrying the same new commit are fetched together and merged once."""
+    local_path, remote_path = synced_repos
+    mirror_path = tmp_path / "mirror.git"
+    Repo.init(mirror_path, bare=True)
+    local_repo = Repo(local_path)
+    local_repo.create_remote("mirror", str(mirror_path))
+    local_repo.git.push("mirror", "ganban")
+
+    with tempfile.TemporaryDirectory() as other_path:
+        other_repo = Repo.clone_from(str(remote_path), other_path)
+        other_repo.git.checkout("ganban")
+        other_board = load_board(other_path)
+        create_card(other_board, "Remote card", "Added remotely.")
+        remote_commit = save_board(other_board, message="Add remote card")
+        other_repo.git.push("origin", "ganban")
+        other_repo.git.push(str(mirror_path), "ganban")
+
+    board = load_board(str(local_path))
+    _init_sync_state(board, local=True, remote=True)
+
+    await run_sync_cycle(board)
+
+    assert board.git.sync.status == "idle"
+    assert board.commit == remote_commit
+    assert len(board.cards) == 2
+    assert local_repo.commit("mirror/ganban").hexsha == remote_commit
+
+
+@pytest.mark.asyncio
+async def test_sync_reload_recycles_card_nodes(local_repo):
+    """Merging external changes updates existing card nodes in place."""
+    board = load_board(str(local_repo))
+    _init_sync_state(board, local=True, remote=False)
+    card = board.cards["1"]
+    sections = card.sections
+
+    ext_board = load_board(str(local_repo))
+    ext_board.cards["1"].sections["First card"] = "Edited externally."
+    save_board(ext_board, message="External edit")
+
+    await run_sync_cycle(board)
+
+    assert board.cards["1"] is card
+    assert card.sections is sections
+    assert card.sections["First card"] == "Edited externally."
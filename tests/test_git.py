@@ -1,17 +1,25 @@
 """Tests for git module."""
 
+import os
+import subprocess
+from pathlib import Path
+
 import pytest
 from git import Repo
 
 from ganban.git import (
     create_orphan_branch,
     fetch,
+    fetch_if_advanced_sync,
     get_remotes,
     has_branch,
     init_repo,
     is_git_repo,
+    ls_remote_sync,
     push,
     read_git_config,
+    remote_tracking_commit,
+    run_git,
     write_git_config_key,
 )
 
@@ -91,6 +99,43 @@ async def test_push(temp_repo_with_remote):
     assert "origin/ganban" in [ref.name for ref in repo.refs]
 
 
+def test_ls_remote_missing_branch(temp_repo_with_remote):
+    assert ls_remote_sync(temp_repo_with_remote, "origin") is None
+
+
+def test_fetch_if_advanced(temp_repo_with_remote):
+    """Reports a fetch only when the remote branch differs from our tracking ref."""
+    repo = Repo(temp_repo_with_remote)
+    repo.git.checkout("-b", "ganban")
+    repo.git.push("origin", "ganban")
+    tip = repo.head.commit.hexsha
+
+    assert ls_remote_sync(temp_repo_with_remote, "origin") == tip
+    assert remote_tracking_commit(temp_repo_with_remote, "origin") == tip
+    assert fetch_if_advanced_sync(temp_repo_with_remote, "origin") is False
+
+    # "peer" points at the same remote but has never been fetched
+    assert remote_tracking_commit(temp_repo_with_remote, "peer") is None
+    assert fetch_if_advanced_sync(temp_repo_with_remote, "peer") is True
+    assert remote_tracking_commit(temp_repo_with_remote, "peer") == tip
+    # concurrent fetches of several remotes would race on FETCH_HEAD
+    assert not (Path(repo.git_dir) / "FETCH_HEAD").exists()
+
+
+def test_fetch_prunes_deleted_branch(temp_repo_with_remote):
+    """A branch deleted upstream drops its tracking ref instead of refetching forever."""
+    repo = Repo(temp_repo_with_remote)
+    repo.git.checkout("-b", "ganban")
+    repo.git.push("origin", "ganban")
+    repo.git.checkout("-")
+    repo.git.push("origin", "--delete", "ganban")
+    repo.git.update_ref("refs/remotes/origin/ganban", repo.commit("ganban").hexsha)
+
+    assert fetch_if_advanced_sync(temp_repo_with_remote, "origin") is True
+    assert remote_tracking_commit(temp_repo_with_remote, "origin") is None
+    assert fetch_if_advanced_sync(temp_repo_with_remote, "origin") is False
+
+
 @pytest.mark.asyncio
 async def test_create_orphan_branch(temp_repo):
     """Create an orphan branch without touching working tree."""
@@ -115,6 +160,27 @@ async def test_create_orphan_branch(temp_repo):
     assert (temp_repo / "README.md").exists()
 
 
+def test_run_git_in_repo(temp_repo):
+    """run_git runs in the given repo rather than the current directory."""
+    result = run_git(temp_repo, ["rev-parse", "--show-toplevel"], capture_output=True, check=True)
+    assert result.stdout.decode("utf-8").strip() == str(temp_repo)
+
+
+@pytest.mark.skipif(not subprocess._USE_POSIX_SPAWN, reason="platform has no posix_spawn fast path")
+def test_run_git_uses_posix_spawn(temp_repo, monkeypatch):
+    """git is started with posix_spawn instead of fork+exec."""
+    spawned = []
+    real_spawn = os.posix_spawn
+
+    def spawn(path, argv, env, **kwargs):
+        spawned.append(argv[0])
+        return real_spawn(path, argv, env, **kwargs)
+
+    monkeypatch.setattr(os, "posix_spawn", spawn)
+    run_git(temp_repo, ["status"], capture_output=True, check=True)
+    assert spawned and os.path.isabs(spawned[0])
+
+
 def test_is_git_repo_true(temp_repo):
     """Returns True for a git repository."""
     assert is_git_repo(temp_repo) is True
@@ -125,6 +191,19 @@ def test_is_git_repo_false(tmp_path):
     assert is_git_repo(tmp_path) is False
 
 
+def test_is_git_repo_bare(tmp_path):
+    """A bare repository has no .git directory but is still a repo."""
+    Repo.init(tmp_path / "bare.git", bare=True)
+    assert is_git_repo(tmp_path / "bare.git") is True
+
+
+def test_is_git_repo_after_init(tmp_path):
+    """A cached negative answer is dropped once the repo is initialized."""
+    assert is_git_repo(tmp_path) is False
+    init_repo(tmp_path)
+    assert is_git_repo(tmp_path) is True
+
+
 def test_init_repo(tmp_path):
     """Initialize a new git repository."""
     new_repo_path = tmp_path / "new_repo"
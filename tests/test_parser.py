@@ -46,6 +46,21 @@ def test_parse_sections_invalid_front_matter():
     assert sections[0][0] == "Title"
 
 
+def test_parse_sections_tab_indented_front_matter():
+    """Tab-indented, malformed front-matter is dropped rather than read as a scalar."""
+    text = "---\nTitle```py\ntext\r\n\r\n\t```\r\n---\n# Title\n"
+    sections, meta = parse_sections(text)
+    assert meta == {}
+    assert sections[0][0] == "Title"
+
+
+def test_parse_sections_scalar_front_matter():
+    """Front-matter that isn't a mapping is ignored."""
+    sections, meta = parse_sections("---\njust text\n---\n# Title\n")
+    assert meta == {}
+    assert sections[0][0] == "Title"
+
+
 def test_parse_sections_unclosed_front_matter():
     """Front-matter that starts with --- but has no closing --- is ignored."""
     text = "---\nkey: value\n# Title\n"
@@ -56,6 +71,15 @@ def test_parse_sections_unclosed_front_matter():
     assert sections[1][0] == "Title"
 
 
+def test_parse_sections_front_matter_not_shared():
+    """Identical front-matter parses to independent dicts."""
+    text = "---\nlabels:\n  - bug\n---\n# Card"
+    _, first = parse_sections(text)
+    _, second = parse_sections(text)
+    first["labels"].append("ui")
+    assert second == {"labels": ["bug"]}
+
+
 def test_serialize_sections_basic():
     text = serialize_sections([("Title", "Body"), ("Notes", "Stuff")])
     assert "# Title" in text
@@ -70,6 +94,15 @@ def test_serialize_sections_with_meta():
     assert "color: red" in text
 
 
+def test_serialize_sections_long_unicode_meta_roundtrip():
+    """Long escaped strings in meta are folded the same wherever they're dumped."""
+    note = "caf\u00e9 " * 20
+    text = serialize_sections([("Title", "")], {"note": note, "tags": ["a"]})
+    assert text.startswith('---\nnote: "caf\\xE9 caf\\xE9')
+    _, meta = parse_sections(text)
+    assert meta == {"note": note, "tags": ["a"]}
+
+
 def test_serialize_sections_first_is_h1():
     text = serialize_sections([("First", ""), ("Second", "")])
     lines = text.split("\n")
@@ -67,6 +67,23 @@ def test_options_empty_board():
     assert len(options) == 0
 
 
+def test_options_follow_user_and_committer_changes():
+    board = Node(
+        meta={"users": {"Alice": {"emails": ["alice@example.com"]}}},
+        git={"committers": []},
+    )
+    assert [value for _, value in build_assignee_options(board)] == ["Alice <alice@example.com>"]
+
+    board.meta.users.Alice.emoji = "🤖"
+    assert "🤖" in build_assignee_options(board)[0][0]
+
+    board.git.committers = ["Bob <bob@example.com>"]
+    assert [value for _, value in build_assignee_options(board)] == [
+        "Alice <alice@example.com>",
+        "Bob <bob@example.com>",
+    ]
+
+
 # --- Sync tests for resolve_assignee ---
 
 
@@ -89,6 +106,14 @@ def test_resolve_assignee_from_committer():
     assert email == "bob@example.com"
 
 
+def test_resolve_assignee_uses_committer_name():
+    board = Node(meta={}, git={"committers": ["Robert <bob@example.com>", "Bobby <bob@example.com>"]})
+    assert resolve_assignee("bob@example.com", board)[1] == "Robert"
+
+    board.git.committers = ["Rob <bob@example.com>"]
+    assert resolve_assignee("bob@example.com", board)[1] == "Rob"
+
+
 def test_resolve_assignee_bare_email():
     board = Node(meta={}, git={"committers": []})
     emoji, name, email = resolve_assignee("bob@example.com", board)
@@ -271,3 +296,55 @@ async def test_emoji_updates_live_while_typing():
         await pilot.pause()
 
         assert picker.content == ICON_PERSON
+
+
+@pytest.mark.asyncio
+async def test_tag_mounts_search_on_first_edit():
+    app = AssigneeApp(assigned="Alice <alice@example.com>")
+    async with app.run_test() as pilot:
+        widget = app.query_one(AssigneeWidget)
+        tag = widget.query_one(Tag)
+        assert not tag.query(SearchInput)
+
+        widget._start_editing()
+        await pilot.pause()
+        search = tag.query_one(SearchInput)
+        assert app.focused is search.query_one(Input)
+
+        await pilot.press("escape", "escape")
+        await pilot.pause()
+        widget._start_editing()
+        await pilot.pause()
+        assert list(tag.query(SearchInput)) == [search]
+
+
+@pytest.mark.asyncio
+async def test_tag_second_edit_before_search_mounts():
+    app = AssigneeApp(assigned="Alice <alice@example.com>")
+    async with app.run_test() as pilot:
+        tag = app.query_one(AssigneeWidget).query_one(Tag)
+        first = [("Alice", "Alice <alice@example.com>")]
+        latest = [("Bob", "Bob <bob@example.com>")]
+
+        tag.start_editing(first)
+        tag.start_editing(latest)
+        await pilot.pause()
+
+        search = tag.query_one(SearchInput)
+        assert search._options == latest
+        assert app.focused is search.query_one(Input)
+
+
+@pytest.mark.asyncio
+async def test_external_change_updates_tag_in_place():
+    app = AssigneeApp(assigned="Alice <alice@example.com>")
+    async with app.run_test() as pilot:
+        widget = app.query_one(AssigneeWidget)
+        tag = widget.query_one(Tag)
+
+        app.card_meta.assigned = "Bob <bob@example.com>"
+        await pilot.pause()
+
+        assert list(widget.query(Tag)) == [tag]
+        assert tag.value == "Bob <bob@example.com>"
+        assert tag.query_one(".tag-label", Static).content == "Bob"
@@ -0,0 +1,336 @@
+"""Tests for the board screen."""
+
+import asyncio
+
+import pytest
+from git import Repo
+from textual.app import App
+
+import ganban.ui.board as board_module
+import ganban.ui.column as column_module
+from ganban.model.card import create_card
+from ganban.model.column import create_column
+from ganban.model.loader import load_board
+from ganban.model.node import ListNode, Node
+from ganban.model.writer import save_board
+from ganban.ui.board import EDIT_QUIET_PERIOD, MIN_SYNC_INTERVAL, BoardScreen
+from ganban.ui.card import AddCard, CardWidget
+from ganban.ui.column import ColumnWidget
+from tests.ui.conftest import GANBAN_CSS_PATH
+
+
+class BoardTestApp(App):
+    """Minimal app hosting a board screen."""
+
+    CSS_PATH = GANBAN_CSS_PATH
+
+    def __init__(self, board):
+        super().__init__()
+        self._board = board
+
+    def on_mount(self):
+        self.push_screen(BoardScreen(self._board))
+
+
+@pytest.fixture
+def board(tmp_path):
+    """A saved board with sync config, loaded back from git."""
+    repo = Repo.init(tmp_path)
+    (tmp_path / ".gitkeep").write_text("")
+    repo.index.add([".gitkeep"])
+    repo.index.commit("Initial commit")
+    board = Node(repo_path=str(tmp_path))
+    board.sections = ListNode()
+    board.sections["Board"] = ""
+    board.meta = {}
+    board.cards = ListNode()
+    board.columns = ListNode()
+    create_column(board, "Backlog", order="1")
+    create_column(board, "Doing", order="2")
+    save_board(board, message="Initialize board")
+    board = load_board(str(tmp_path))
+    board.git.config = Node(ganban=Node(sync_local=True, sync_remote=False, sync_interval=10))
+    return board
+
+
+@pytest.mark.asyncio
+async def test_sync_delay_resets_on_change_and_backs_off_to_interval(board):
+    """A new commit drops the delay to the floor; quiet cycles double it up to sync_interval."""
+    app = BoardTestApp(board)
+    async with app.run_test():
+        screen = app.screen
+        config = board.git.config.ganban
+        # Toggles off keep the screen's own timer from starting cycles mid-test
+        config.sync_local = False
+        await screen._run_sync()
+        assert screen._sync_delay is None
+
+        create_card(board, "New card", "")
+        config.sync_local = True
+        await screen._run_sync()
+        assert screen._sync_delay == MIN_SYNC_INTERVAL
+
+        config.sync_local = False
+        delays = []
+        for _ in range(3):
+            await screen._run_sync()
+            delays.append(screen._sync_delay)
+        assert delays == [MIN_SYNC_INTERVAL * 2, MIN_SYNC_INTERVAL * 4, 10]
+
+
+@pytest.mark.asyncio
+async def test_sync_due_debounces_edits_and_respects_interval(board):
+    """Idle boards wait the full interval; edits sync after a quiet period."""
+    app = BoardTestApp(board)
+    async with app.run_test():
+        screen = app.screen
+        board.git.config.ganban.sync_local = False
+        screen._last_sync = 100.0
+        assert not screen._sync_due(109.0)
+        assert screen._sync_due(110.0)
+
+        # An edit syncs once edits stop, but keeps waiting while they continue
+        screen._last_edit = 101.0
+        assert not screen._sync_due(101.0 + EDIT_QUIET_PERIOD - 0.5)
+        assert screen._sync_due(101.0 + EDIT_QUIET_PERIOD)
+        screen._last_edit = 109.0
+        assert not screen._sync_due(109.9)
+        assert screen._sync_due(110.0)
+
+        # The floor never exceeds a shorter configured interval
+        board.git.config.ganban.sync_interval = 1
+        screen._last_edit = None
+        assert screen._sync_intervals() == (1, 1)
+        assert screen._sync_due(101.0)
+
+
+@pytest.mark.asyncio
+async def test_column_move_request_reorders_columns(board):
+    """Moving a column right swaps it with its neighbour, and stops at the edge."""
+    app = BoardTestApp(board)
+    async with app.run_test() as pilot:
+        first = app.screen.query(ColumnWidget).first()
+        first.post_message(ColumnWidget.MoveRequested(first, 1))
+        await pilot.pause()
+        first.post_message(ColumnWidget.MoveRequested(first, 1))
+        await pilot.pause()
+
+        titles = [c.sections.keys()[0] for c in board.columns]
+        assert titles == ["Doing", "Backlog"]
+        assert [w.column for w in app.screen.query(ColumnWidget)] == list(board.columns)
+
+
+@pytest.mark.asyncio
+async def test_drag_card_to_another_column(board):
+    """Dragging a card onto another column moves it there."""
+    create_card(board, "Drag me", "", column=board.columns["1"])
+    app = BoardTestApp(board)
+    async with app.run_test(size=(100, 30)) as pilot:
+        card = app.screen.query_one(CardWidget)
+        target = app.screen.query(ColumnWidget).last()
+        await pilot.mouse_down(card)
+        dx = target.region.x - card.region.x + 2
+        await pilot.hover(card, offset=(dx // 2, 1))
+        await pilot.hover(card, offset=(dx, 1))
+        await pilot.mouse_up(card, offset=(dx, 1))
+        await pilot.pause()
+
+        assert board.columns["1"].links == ()
+        assert list(board.columns["2"].links) == [card.card_id]
+
+
+class _Move:
+    def __init__(self, x, y):
+        self.screen_x = x
+        self.screen_y = y
+
+
+@pytest.mark.asyncio
+async def test_drag_moves_are_coalesced(board):
+    """Queued mouse moves during a drag reach the draggable once, at the latest position."""
+    app = BoardTestApp(board)
+    async with app.run_test() as pilot:
+        screen = app.screen
+
+        class Draggable:
+            def __init__(self):
+                self.moves = []
+
+            def _drag_move(self, x, y):
+                self.moves.append((x, y))
+
+        draggable = Draggable()
+        screen._active_draggable = draggable
+        for x in range(5):
+            screen.on_mouse_move(_Move(x, 3))
+        await pilot.pause()
+        screen._active_draggable = None
+
+        assert draggable.moves == [(4, 3)]
+
+
+@pytest.mark.asyncio
+async def test_card_insert_position_follows_pointer(board):
+    """The insertion point is the first card whose midpoint is below the pointer."""
+    for i in range(5):
+        create_card(board, f"Card {i}", "", column=board.columns["1"])
+    app = BoardTestApp(board)
+    async with app.run_test(size=(100, 60)) as pilot:
+        await pilot.pause()
+        column = app.screen.query(ColumnWidget).first()
+        cards = list(column.query_children(CardWidget))
+        for y in range(column.region.y, column.region.bottom):
+            expected = next(
+                (c for c in cards if y < c.region.y + c.region.height // 2),
+                column.query_children(AddCard).first(),
+            )
+            assert column._calculate_card_insert_position(None, y) is expected
+            pos, _ = column._card_insert_slot(None, y)
+            assert pos == (cards.index(expected) if expected in cards else len(cards))
+
+
+@pytest.mark.asyncio
+async def test_card_placeholder_stays_put_within_a_slot(board, monkeypatch):
+    """Hovering within one slot does not look at the column's children again."""
+    for i in range(3):
+        create_card(board, f"Card {i}", "", column=board.columns["1"])
+    app = BoardTestApp(board)
+    async with app.run_test(size=(100, 60)) as pilot:
+        await pilot.pause()
+        column = app.screen.query(ColumnWidget).first()
+        first = column.query_children(CardWidget).first()
+        y = first.region.y
+        column._ensure_card_placeholder(column._calculate_card_insert_position(None, y))
+        await pilot.pause()
+
+        checks = []
+        monkeypatch.setattr(column_module, "is_just_before", lambda *args: checks.append(args) or True)
+        for _ in range(3):
+            column._ensure_card_placeholder(column._calculate_card_insert_position(None, y))
+        assert checks == []
+        assert column.children[column.children.index(column._card_placeholder) + 1] is first
+
+
+@pytest.mark.asyncio
+async def test_column_ghost_follows_pointer_and_resets(board):
+    """A dragged column is offset with the pointer and put back on cancel."""
+    app = BoardTestApp(board)
+    async with app.run_test(size=(100, 30)) as pilot:
+        await pilot.pause()
+        column = app.screen.query(ColumnWidget).first()
+        start = column.region.offset
+        column._drag_start(start)
+        column._reposition_ghost(start.x + 5, start.y)
+        column._reposition_ghost(start.x + 5, start.y)
+        assert column.styles.offset.x.value == start.x + 5 - column.parent.region.x
+        column._drag_cancel()
+        assert column.styles.offset.x.value == 0
+        assert column._ghost_offset is None
+
+
+@pytest.mark.asyncio
+async def test_save_commits_only_when_changed(board):
+    """Saving an unchanged board keeps the commit; an edit makes a new one."""
+    app = BoardTestApp(board)
+    async with app.run_test():
+        screen = app.screen
+        board.git.config.ganban.sync_local = False
+        commit = board.commit
+        await screen.action_save()
+        assert board.commit == commit
+
+        create_card(board, "New card", "")
+        await screen.action_save()
+        assert board.commit != commit
+        assert load_board(board.repo_path).cards.keys() == board.cards.keys()
+
+
+@pytest.mark.asyncio
+async def test_board_title_follows_model_rename(board):
+    """Renaming the board in the model updates the header."""
+    app = BoardTestApp(board)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        board.sections.rename_first_key("Roadmap")
+        await pilot.pause()
+        assert app.screen._header.value == "Roadmap"
+
+
+@pytest.mark.asyncio
+async def test_overlapping_saves_run_once(board, monkeypatch):
+    """A save requested while another is running is dropped."""
+    saves = []
+
+    def counting_save(board, *args, **kwargs):
+        saves.append(board)
+        return save_board(board, *args, **kwargs)
+
+    monkeypatch.setattr(board_module, "save_board", counting_save)
+    app = BoardTestApp(board)
+    async with app.run_test():
+        screen = app.screen
+        board.git.config.ganban.sync_local = False
+        commit = board.commit
+        create_card(board, "New card", "")
+        await asyncio.gather(screen.action_save(), screen.action_save())
+        assert len(saves) == 1
+        assert Repo(board.repo_path).commit(board.commit).parents[0].hexsha == commit
+
+
+@pytest.mark.asyncio
+async def test_save_waits_for_running_sync(board, monkeypatch):
+    """ctrl+s during a sync cycle saves only after the cycle has finished."""
+    saves = []
+
+    def counting_save(board, *args, **kwargs):
+        saves.append(board)
+        return save_board(board, *args, **kwargs)
+
+    monkeypatch.setattr(board_module, "save_board", counting_save)
+    app = BoardTestApp(board)
+    async with app.run_test():
+        screen = app.screen
+        board.git.config.ganban.sync_local = False
+        release = asyncio.Event()
+        screen._sync_task = asyncio.create_task(release.wait())
+        create_card(board, "New card", "")
+        save = asyncio.create_task(screen.action_save())
+        await asyncio.sleep(0.05)
+        assert saves == []
+        release.set()
+        await save
+        assert len(saves) == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_waits_for_running_save(board):
+    """The sync timer doesn't start a cycle while a ctrl+s save holds the lock."""
+    app = BoardTestApp(board)
+    async with app.run_test():
+        screen = app.screen
+        screen._last_sync = 0.0
+        async with screen._save_lock:
+            screen._sync_tick()
+            assert screen._sync_task is None
+        screen._sync_tick()
+        assert screen._sync_task is not None
+        await screen._sync_task
+
+
+@pytest.mark.asyncio
+async def test_column_insert_position_follows_pointer(board):
+    """The insertion point is the first column whose midpoint is right of the pointer."""
+    create_column(board, "Done", order="3")
+    app = BoardTestApp(board)
+    async with app.run_test(size=(120, 30)) as pilot:
+        await pilot.pause()
+        screen = app.screen
+        columns = list(screen._columns.query_children(ColumnWidget))
+        for x in range(screen._add_column.region.right):
+            expected = next(
+                (i for i, c in enumerate(columns) if x < c.region.x + c.region.width // 2),
+                len(columns),
+            )
+            pos, widget = screen._column_insert_slot(None, x)
+            assert pos == expected
+            assert widget is (columns[pos] if pos < len(columns) else screen._add_column)
@@ -130,6 +130,29 @@ async def test_reactive_section_updates_title():
         assert "New Title" in str(title.render())
 
 
+@pytest.mark.asyncio
+async def test_unrelated_meta_change_does_not_rerender_zones():
+    """A meta change that doesn't alter the card's text leaves its zones alone."""
+    board = _make_board(body="Body")
+    app = CardTestApp(board)
+    async with app.run_test() as pilot:
+        # First refresh redraws the header at its real width
+        board.cards["1"].meta.notes = "warm up"
+        await pilot.pause()
+        refreshed = []
+        for zone in app.query(PlainStatic):
+            zone.refresh = lambda *a, _id=zone.id, **kw: refreshed.append(_id)
+
+        board.cards["1"].meta.notes = "not shown on the card"
+        await pilot.pause()
+        assert refreshed == []
+
+        board.cards["1"].meta.due = (date.today() + timedelta(days=3)).isoformat()
+        await pilot.pause()
+        assert "card-footer" in refreshed
+        assert "card-title" not in refreshed
+
+
 @pytest.mark.asyncio
 async def test_watcher_cleanup():
     """Watchers are removed after card widget is removed."""
@@ -0,0 +1,40 @@
+"""Tests for drag-and-drop helpers."""
+
+import pytest
+from textual.app import App, ComposeResult
+from textual.containers import Horizontal
+from textual.widgets import Static
+
+from ganban.ui.drag import reorder_children
+
+
+class ReorderApp(App):
+    def compose(self) -> ComposeResult:
+        with Horizontal():
+            for name in "abcde":
+                yield Static(name, id=name)
+            yield Static("+", id="end")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("order", ["abcde", "eabcd", "bcdea", "aedcb", "edcba", "badce"])
+async def test_reorder_children_matches_order_with_fewest_moves(order):
+    app = ReorderApp()
+    async with app.run_test() as pilot:
+        container = app.query_one(Horizontal)
+        moves = []
+        move_child = container.move_child
+
+        def spy(child, *args, **kwargs):
+            moves.append(child.id)
+            return move_child(child, *args, **kwargs)
+
+        container.move_child = spy
+        widgets = [app.query_one(f"#{name}") for name in order]
+        reorder_children(container, widgets, before=app.query_one("#end"))
+        await pilot.pause()
+
+        assert [c.id for c in container.children] == [*order, "end"]
+        # everything outside one longest in-order run gets moved exactly once
+        expected = {"abcde": 0, "eabcd": 1, "bcdea": 1, "aedcb": 3, "edcba": 4, "badce": 2}
+        assert len(moves) == expected[order]
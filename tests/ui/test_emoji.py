@@ -223,6 +223,21 @@ def test_resolve_email_emoji_unknown():
     assert resolve_email_emoji("bob@example.com", meta) == emoji_for_email("bob@example.com")
 
 
+def test_resolve_email_emoji_follows_user_changes():
+    """Lookups see users and emails edited after an earlier lookup."""
+    meta = Node(users={"Alice": {"emoji": "🤖", "emails": ["alice@example.com"]}})
+    assert resolve_email_emoji("alice@example.com", meta) == "🤖"
+
+    meta.users.Alice.emoji = "🐱"
+    meta.users.Bob = {"emoji": "🐶", "emails": ["bob@example.com"]}
+    assert resolve_email_emoji("alice@example.com", meta) == "🐱"
+    assert resolve_email_emoji("bob@example.com", meta) == "🐶"
+
+    meta.users.Alice.emails = ["alice@work.example.com"]
+    assert resolve_email_emoji("alice@work.example.com", meta) == "🐱"
+    assert resolve_email_emoji("alice@example.com", meta) == emoji_for_email("alice@example.com")
+
+
 def test_resolve_email_emoji_no_users():
     """Falls back to hash when meta has no users."""
     meta = Node()
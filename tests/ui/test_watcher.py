@@ -9,6 +9,10 @@ class FakeWidget(NodeWatcherMixin):
 
     def __init__(self):
         self._init_watcher()
+        self.scheduled = []
+
+    def call_later(self, callback):
+        self.scheduled.append(callback)
 
 
 def test_watch_fires_callback():
@@ -83,3 +87,21 @@ def test_suppression_is_exception_safe():
     assert not widget._suppressing
     node.color = "blue"
     assert calls == ["blue"]
+
+
+def test_call_later_once_coalesces_until_run():
+    widget = FakeWidget()
+    calls = []
+
+    def refresh():
+        calls.append("refresh")
+
+    widget.call_later_once(refresh)
+    widget.call_later_once(refresh)
+    assert len(widget.scheduled) == 1
+
+    widget.scheduled.pop()()
+    assert calls == ["refresh"]
+
+    widget.call_later_once(refresh)
+    assert len(widget.scheduled) == 1